@@ -24,7 +24,7 @@ from .beacon_sdk import (
 from .decorators import beacon_task, beacon_agent
 from .sync_wrapper import SyncBeacon
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 __all__ = [
     "AgentBeacon",
     "SignalLien",
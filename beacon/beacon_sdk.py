@@ -5,21 +5,101 @@ Core SDK for emitting signal liens to Agent Highway Origin.
 """
 
 import asyncio
+import gzip
 import hashlib
 import json
+import random
 import secrets
+import sys
+import threading
 import time
 import uuid
-from dataclasses import dataclass, asdict
+import weakref
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import date, datetime, time as dt_time
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import logging
 
 import aiohttp
 
+# Optional fast JSON support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional HTTP/2 transport support
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Optional zstd request compression
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Identifier sent with each lien for the MAC produced by AgentBeacon._sign
+SIGNATURE_ALGORITHM = "blake2b-128"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_BATCH_PATH = "/beacon/batch"
+
+# Non-5xx statuses worth retrying: request timeout and rate limiting
+_RETRYABLE_STATUSES = frozenset({408, 429})
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON types orjson handles natively, the same way it does"""
+    if isinstance(obj, (datetime, date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes.
+    
+    Uses orjson when installed. The stdlib fallback matches its separators,
+    key order and raw UTF-8, but not every float: exponents are spelled
+    1e+16 rather than 1e16, so the payload_hash of such a payload depends
+    on which backend is available. Non-finite floats become null with
+    orjson and raise ValueError with the fallback, never invalid JSON.
+    Raises TypeError for values neither can serialize.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False,
+        allow_nan=False, default=_json_default
+    ).encode()
+
+
+@lru_cache(maxsize=256)
+def _digest_payload(canonical: bytes) -> str:
+    """16-hex-char digest of a canonical payload; repeats are served from cache."""
+    return hashlib.blake2b(canonical, digest_size=8).hexdigest()
+
 
 class EventType(str, Enum):
     """Types of signal lien events."""
@@ -32,6 +112,11 @@ class EventType(str, Enum):
     ERROR = "error"
 
 
+# Wire value for every accepted event type. EventType is a str enum, so
+# members and their plain-string values hash alike and both look up here.
+_EVENT_TYPE_VALUES: Dict[str, str] = {member.value: member.value for member in EventType}
+
+
 class BeaconError(Exception):
     """Base exception for beacon errors."""
     pass
@@ -47,7 +132,7 @@ class NetworkError(BeaconError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalLien:
     """A signal lien (existence proof) emitted by an agent."""
     agent_id: str
@@ -63,10 +148,27 @@ class SignalLien:
     public_key: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
     lane: Optional[str] = None
+    sig_alg: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
+        # Built field by field: asdict() deep-copies every value
+        data = {
+            "agent_id": self.agent_id,
+            "agent_type": self.agent_type,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "sequence": self.sequence,
+            "signature": self.signature,
+            "task_id": self.task_id,
+            "parent_agent_id": self.parent_agent_id,
+            "target_agent_id": self.target_agent_id,
+            "payload_hash": self.payload_hash,
+            "public_key": self.public_key,
+            "metadata": self.metadata,
+            "lane": self.lane,
+            "sig_alg": self.sig_alg,
+        }
         # Remove None values
         return {k: v for k, v in data.items() if v is not None}
 
@@ -76,11 +178,86 @@ class BeaconConfig:
     """Configuration for the beacon emitter."""
     endpoint: str = "https://agent-highway-origin.yksanjo.workers.dev"
     heartbeat_interval: int = 30  # seconds
+    heartbeat_max_silence: float = 25  # seconds an unchanged agent may skip heartbeats
     timeout: int = 5  # seconds for HTTP requests
     max_retries: int = 3
     retry_delay: float = 1.0
     auto_heartbeat: bool = True
     lane: str = "default"  # Protocol lane: a2a, mcp, custom
+    batch_emit: bool = False  # Queue liens and POST them to /beacon/batch
+    batch_max_size: int = 64  # Max liens per batch request
+    batch_max_latency_ms: int = 100  # Max time a lien waits in the queue
+    include_arg_metadata: bool = False  # @beacon_task sends argument type names
+    sign_liens: bool = False  # MAC-sign liens (only needed if the collector verifies)
+    retry_queue_size: int = 1000  # Failed requests waiting for a background retry
+    track_task_ids: bool = False  # Keep the set of active task IDs, not just a count
+    http2: bool = False  # Multiplex requests over HTTP/2 (needs httpx[http2])
+    compression: Optional[str] = None  # "zstd" or "gzip" request bodies (Origin decodes gzip)
+    compress_min_bytes: int = 512  # Smaller bodies are sent uncompressed
+
+
+# One pooled HTTP client per event loop (and transport), shared by every
+# beacon on that loop and reference-counted so it closes when the last
+# beacon disconnects.
+_shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, List[Any]]]" = weakref.WeakKeyDictionary()
+_shared_sessions_lock = threading.Lock()
+
+
+def _new_session(http2: bool) -> Any:
+    """Build a pooled client: httpx over HTTP/2, or aiohttp over HTTP/1.1."""
+    if http2:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=75
+            )
+        )
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        keepalive_timeout=75
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar()
+    )
+
+
+def _session_closed(session: Any) -> bool:
+    if isinstance(session, aiohttp.ClientSession):
+        return session.closed
+    return session.is_closed
+
+
+def _acquire_shared_session(http2: bool = False) -> Any:
+    """Get (or lazily create) the shared client for the running loop."""
+    loop = asyncio.get_running_loop()
+    with _shared_sessions_lock:
+        per_loop = _shared_sessions.setdefault(loop, {})
+        entry = per_loop.get(http2)
+        if entry is None or _session_closed(entry[0]):
+            entry = per_loop[http2] = [_new_session(http2), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+async def _release_shared_session(session: Any) -> None:
+    """Drop one reference to a shared client, closing it on the last one."""
+    loop = asyncio.get_running_loop()
+    with _shared_sessions_lock:
+        per_loop = _shared_sessions.get(loop, {})
+        for http2, entry in list(per_loop.items()):
+            if entry[0] is session:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del per_loop[http2]
+    if isinstance(session, aiohttp.ClientSession):
+        await session.close()
+    else:
+        await session.aclose()
 
 
 class AgentBeacon:
@@ -124,20 +301,67 @@ class AgentBeacon:
         
         # State
         self._sequence = 0
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[Any] = None  # aiohttp.ClientSession or httpx.AsyncClient
+        self._http2 = False
+        self._timeout = aiohttp.ClientTimeout(total=self.config.timeout)
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._retry_queue: Optional[asyncio.Queue] = None
+        self._retry_task: Optional[asyncio.Task] = None
         self._shutdown = False
-        self._birth_time = time.time()
+        self._birth_time = time.time()  # Wall clock, reported in the birth lien
+        self._birth_monotonic = time.monotonic()  # For lifetimes, immune to clock jumps
+        
+        # Signing key (for future Ed25519 implementation). Keys and signing
+        # state are derived on first use, so unsigned beacons never pay for
+        # key generation.
+        self._private_key_value = private_key
+        self._public_key_value: Optional[str] = None
+        self._mac_prefix = None
+        self._signed_base_lien: Optional[Dict[str, Any]] = None
+        
+        # Lien fields that are identical on every emit
+        self._base_lien: Dict[str, Any] = {
+            "agent_id": self.agent_id,
+            "agent_type": self.agent_type,
+            "lane": self.config.lane,
+            "signature": "",
+        }
         
-        # Signing key (for future Ed25519 implementation)
-        self._private_key = private_key or secrets.token_hex(32)
-        self._public_key = hashlib.sha256(self._private_key.encode()).hexdigest()[:32]
+        # Request body compression; zstd falls back to gzip when unavailable
+        self._content_encoding = self.config.compression
+        self._zstd = None
+        if self._content_encoding == "zstd":
+            if ZSTD_AVAILABLE:
+                # Per beacon: compressor objects must not be used concurrently
+                self._zstd = zstandard.ZstdCompressor(level=3)
+            else:
+                logger.warning("zstd compression requested but zstandard is not installed; using gzip")
+                self._content_encoding = "gzip"
+        elif self._content_encoding not in (None, "gzip"):
+            raise ValueError(f"Unsupported compression: {self._content_encoding!r}")
         
-        # Task tracking
-        self._active_tasks: set = set()
+        # Task tracking: a plain count unless the IDs themselves were asked for
+        self._active_task_count = 0
+        self._active_tasks: Optional[set] = set() if self.config.track_task_ids else None
         
         logger.debug(f"Beacon initialized for agent {self.agent_id} ({self.agent_type})")
     
+    @property
+    def _private_key(self) -> str:
+        """Signing key, generated on first use if none was provided."""
+        if self._private_key_value is None:
+            self._private_key_value = secrets.token_hex(32)
+        return self._private_key_value
+    
+    @property
+    def _public_key(self) -> str:
+        """Identifier derived from the signing key, computed on first use."""
+        if self._public_key_value is None:
+            self._public_key_value = hashlib.sha256(self._private_key.encode()).hexdigest()[:32]
+        return self._public_key_value
+    
     async def __aenter__(self):
         """Async context manager entry."""
         await self.connect()
@@ -149,54 +373,286 @@ class AgentBeacon:
         await self.shutdown()
     
     async def connect(self):
-        """Initialize HTTP session."""
+        """Attach to the shared HTTP session and start the background workers."""
         if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            self._http2 = self.config.http2 and HTTPX_AVAILABLE
+            if self.config.http2 and not HTTPX_AVAILABLE:
+                logger.warning("http2 requested but httpx[http2] is not installed; using HTTP/1.1")
+            self._session = _acquire_shared_session(self._http2)
+        
+        if self._retry_task is None:
+            self._retry_queue = asyncio.Queue(maxsize=self.config.retry_queue_size)
+            self._retry_task = asyncio.create_task(self._retry_loop())
+        
+        if self.config.batch_emit and self._flusher_task is None:
+            self._queue = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._flush_loop())
     
     async def disconnect(self):
-        """Close HTTP session."""
+        """Release the shared HTTP session."""
+        await self._stop_flusher()
+        await self._stop_retries()
         if self._session:
-            await self._session.close()
+            await _release_shared_session(self._session)
             self._session = None
     
+    async def flush(self):
+        """Post any queued liens now and wait until the collector has them."""
+        if self._queue is not None and self._flusher_task is not None:
+            # None tells the flusher to stop waiting for a fuller batch
+            self._queue.put_nowait(None)
+            await self._queue.join()
+    
+    async def _stop_flusher(self):
+        """Drain the batch queue and stop the flusher task."""
+        if self._flusher_task is None:
+            return
+        await self.flush()
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+        self._flusher_task = None
+        self._queue = None
+    
+    async def _flush_loop(self):
+        """
+        Coalesce queued liens into batch requests.
+        
+        Waits for the first lien, then keeps collecting until either
+        ``batch_max_size`` liens are gathered or ``batch_max_latency_ms``
+        has elapsed (or `flush()` is called), and posts them as a single
+        request.
+        """
+        loop = asyncio.get_running_loop()
+        max_size = self.config.batch_max_size
+        max_latency = self.config.batch_max_latency_ms / 1000
+        
+        while True:
+            items = [await self._queue.get()]
+            deadline = loop.time() + max_latency
+            
+            while items[-1] is not None and len(items) < max_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            batch = [lien for lien in items if lien is not None]
+            try:
+                if batch and await self._post(_BATCH_PATH, b"[" + b",".join(batch) + b"]"):
+                    logger.debug(f"Beacon batch emitted: {len(batch)} liens")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+    
+    async def _stop_retries(self):
+        """Stop the retry worker, dropping anything still waiting."""
+        if self._retry_task is None:
+            return
+        self._retry_task.cancel()
+        try:
+            await self._retry_task
+        except asyncio.CancelledError:
+            pass
+        pending = self._retry_queue.qsize()
+        if pending:
+            logger.warning(f"Dropping {pending} beacon request(s) pending retry")
+        self._retry_task = None
+        self._retry_queue = None
+    
+    async def _retry_loop(self):
+        """
+        Retry failed requests off the caller's path.
+        
+        Each retry waits ``retry_delay * 2**(attempt - 1)`` plus up to
+        ``retry_delay`` of random jitter, so agents recovering from the same
+        collector outage do not all retry at once.
+        """
+        delay = self.config.retry_delay
+        while True:
+            path, body, headers, attempt = await self._retry_queue.get()
+            try:
+                await asyncio.sleep(delay * (2 ** (attempt - 1)) + random.uniform(0, delay))
+                if await self._send(path, body, headers) is None:
+                    self._schedule_retry(path, body, headers, attempt + 1)
+            finally:
+                self._retry_queue.task_done()
+    
+    def _schedule_retry(self, path: str, body: bytes, headers: Dict[str, str], attempt: int):
+        """Queue a failed request for its next attempt, if any remain."""
+        if attempt >= self.config.max_retries or self._retry_queue is None:
+            logger.error(f"Failed to emit beacon after {attempt} attempts")
+            return
+        try:
+            self._retry_queue.put_nowait((path, body, headers, attempt))
+        except asyncio.QueueFull:
+            logger.error("Beacon retry queue full, dropping request")
+    
+    async def _post(self, path: str, body: bytes) -> bool:
+        """
+        POST a serialized JSON body to the collector.
+        
+        Makes one attempt; transient failures are handed to the background
+        retry worker and reported as False.
+        
+        Returns:
+            True if the collector accepted the body, False otherwise
+        """
+        body, headers = self._encode_body(body)
+        result = await self._send(path, body, headers)
+        if result is None:
+            self._schedule_retry(path, body, headers, 1)
+        return bool(result)
+    
+    def _encode_body(self, body: bytes) -> Tuple[bytes, Dict[str, str]]:
+        """Compress the body if configured and large enough to be worth it."""
+        if self._content_encoding is None or len(body) < self.config.compress_min_bytes:
+            return body, _JSON_HEADERS
+        if self._zstd is not None:
+            body = self._zstd.compress(body)
+        else:
+            body = gzip.compress(body, compresslevel=5)
+        return body, {**_JSON_HEADERS, "Content-Encoding": self._content_encoding}
+    
+    async def _send(self, path: str, body: bytes, headers: Dict[str, str]) -> Optional[bool]:
+        """
+        Make a single POST attempt.
+        
+        Returns:
+            True if accepted, False if rejected outright, None on a
+            transient failure worth retrying
+        """
+        url = f"{self.config.endpoint}{path}"
+        try:
+            if self._http2:
+                response = await self._session.post(
+                    url,
+                    content=body,
+                    headers=headers,
+                    timeout=self.config.timeout
+                )
+                status, text = response.status_code, response.text
+            else:
+                async with self._session.post(
+                    url,
+                    data=body,
+                    headers=headers,
+                    timeout=self._timeout
+                ) as response:
+                    status = response.status
+                    # Batch responses list rejected liens even on 201
+                    if status == 401 or (status == 201 and path != _BATCH_PATH):
+                        text = ""
+                    else:
+                        text = await response.text()
+                    
+        except asyncio.TimeoutError:
+            logger.warning("Beacon timeout")
+            return None
+        except Exception as e:
+            logger.warning(f"Beacon emit error: {e}")
+            return None
+        
+        if status == 201:
+            if path == _BATCH_PATH:
+                self._log_batch_rejections(text)
+            return True
+        elif status == 401:
+            logger.error("Beacon authentication failed")
+            return False
+        
+        logger.warning(f"Beacon emit failed: {status} - {text}")
+        # Other client errors (bad fields, unsupported encoding) fail the
+        # same way every time
+        if status in _RETRYABLE_STATUSES or status >= 500:
+            return None
+        return False
+    
+    @staticmethod
+    def _log_batch_rejections(text: str):
+        """
+        Log liens the collector refused from an accepted batch.
+        
+        A batch is answered with 201 once it has been processed; liens that
+        failed validation are listed in its ``rejected`` field. They fail
+        for good (bad fields, sequence or signature), so they are logged,
+        not retried.
+        """
+        try:
+            rejected = json.loads(text).get("rejected") or []
+        except (ValueError, AttributeError):
+            return
+        if rejected:
+            details = "; ".join(f"#{r.get('index')}: {r.get('error')}" for r in rejected)
+            logger.warning(f"Collector rejected {len(rejected)} lien(s) in batch: {details}")
+    
     def _generate_signature(self, lien: SignalLien) -> str:
         """
         Generate a signature for the lien.
         
-        Note: Currently uses HMAC-SHA256 for MVP. In production,
-        this should use Ed25519 signatures.
-        """
-        # Create message from lien fields (excluding signature)
-        message_data = {
-            "agent_id": lien.agent_id,
-            "agent_type": lien.agent_type,
-            "timestamp": lien.timestamp,
-            "event_type": lien.event_type,
-            "task_id": lien.task_id,
-            "parent_agent_id": lien.parent_agent_id,
-            "target_agent_id": lien.target_agent_id,
-            "payload_hash": lien.payload_hash,
-            "sequence": lien.sequence,
-        }
-        message = json.dumps(message_data, sort_keys=True)
+        The signed message is agent_id, agent_type, timestamp, sequence,
+        event_type, task_id, parent_agent_id, target_agent_id, payload_hash
+        joined with the ASCII unit separator (0x1F); missing values are
+        empty. The agent_id/agent_type prefix is hashed once at init.
         
-        # Generate HMAC
-        signature = hmac.new(
-            self._private_key.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        Note: Currently a keyed BLAKE2b-128 MAC (``sig_alg`` =
+        ``blake2b-128``) for MVP. In production, this should use Ed25519
+        signatures.
+        """
+        return self._sign(
+            lien.timestamp,
+            lien.sequence,
+            _EVENT_TYPE_VALUES[lien.event_type],
+            lien.task_id,
+            lien.parent_agent_id,
+            lien.target_agent_id,
+            lien.payload_hash
+        )
+    
+    def _sign(
+        self,
+        timestamp: int,
+        sequence: int,
+        event_type: str,
+        task_id: Optional[str],
+        parent_agent_id: Optional[str],
+        target_agent_id: Optional[str],
+        payload_hash: Optional[str]
+    ) -> str:
+        """Sign the per-lien fields on top of the cached invariant prefix."""
+        if self._mac_prefix is None:
+            # Keyed BLAKE2b state primed with the fields that never change for
+            # this agent; each signature copies it and only feeds the per-lien fields.
+            key = self._private_key.encode()
+            if len(key) > 64:
+                # BLAKE2b keys are capped at 64 bytes; hash longer keys down like HMAC does
+                key = hashlib.blake2b(key).digest()
+            self._mac_prefix = hashlib.blake2b(key=key, digest_size=16)
+            self._mac_prefix.update(f"{self.agent_id}\x1f{self.agent_type}\x1f".encode())
         
-        return signature
+        h = self._mac_prefix.copy()
+        h.update(
+            f"{timestamp}\x1f{sequence}\x1f{event_type}\x1f"
+            f"{task_id or ''}\x1f{parent_agent_id or ''}\x1f"
+            f"{target_agent_id or ''}\x1f{payload_hash or ''}".encode()
+        )
+        return h.hexdigest()
     
     def _hash_payload(self, payload: Optional[Dict[str, Any]]) -> Optional[str]:
         """Generate a hash of the payload for integrity verification."""
         if payload is None:
             return None
-        return hashlib.sha256(
-            json.dumps(payload, sort_keys=True).encode()
-        ).hexdigest()[:16]
+        return _digest_payload(_json_dumps(payload, sort_keys=True))
     
     async def emit(
         self,
@@ -223,7 +679,11 @@ class AgentBeacon:
             
         Note:
             This method is fire-and-forget. It will not block agent execution
-            and failures are logged but not raised.
+            and failures are logged but not raised. Transient failures are
+            retried in the background, so False does not rule out later
+            delivery. With ``batch_emit``
+            enabled the lien is queued and True means it was accepted for
+            delivery, not that the collector has received it yet.
         """
         if self._shutdown:
             logger.warning("Cannot emit beacon: beacon is shutdown")
@@ -232,60 +692,70 @@ class AgentBeacon:
         if self._session is None:
             await self.connect()
         
+        event = _EVENT_TYPE_VALUES.get(event_type)
+        if event is None:
+            raise ValueError(f"{event_type!r} is not a valid EventType")
+        
         self._sequence += 1
         
-        # Merge metadata
-        merged_metadata = {**self.metadata}
-        if metadata:
-            merged_metadata.update(metadata)
-        
-        # Create lien
-        lien = SignalLien(
-            agent_id=self.agent_id,
-            agent_type=self.agent_type,
-            timestamp=int(time.time() * 1000),
-            event_type=event_type if isinstance(event_type, EventType) else EventType(event_type),
-            sequence=self._sequence,
-            signature="",  # Will be filled
-            task_id=task_id,
-            parent_agent_id=parent_agent_id,
-            target_agent_id=target_agent_id,
-            payload_hash=self._hash_payload(payload),
-            public_key=self._public_key,
-            metadata=merged_metadata if merged_metadata else None,
-            lane=self.config.lane
-        )
+        timestamp = time.time_ns() // 1_000_000
+        try:
+            payload_hash = self._hash_payload(payload)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Beacon payload is not JSON serializable: {e}")
+            return False
         
-        # Sign
-        lien.signature = self._generate_signature(lien)
+        # Build the lien body directly on top of the cached identity fields
+        if self.config.sign_liens:
+            if self._signed_base_lien is None:
+                self._signed_base_lien = {
+                    **self._base_lien,
+                    "public_key": self._public_key,
+                    "sig_alg": SIGNATURE_ALGORITHM,
+                }
+            lien = self._signed_base_lien.copy()
+            lien["signature"] = self._sign(
+                timestamp,
+                self._sequence,
+                event,
+                task_id,
+                parent_agent_id,
+                target_agent_id,
+                payload_hash
+            )
+        else:
+            lien = self._base_lien.copy()
+        lien["timestamp"] = timestamp
+        lien["event_type"] = event
+        lien["sequence"] = self._sequence
+        if task_id is not None:
+            lien["task_id"] = task_id
+        if parent_agent_id is not None:
+            lien["parent_agent_id"] = parent_agent_id
+        if target_agent_id is not None:
+            lien["target_agent_id"] = target_agent_id
+        if payload_hash is not None:
+            lien["payload_hash"] = payload_hash
         
-        # Emit with retries
-        for attempt in range(self.config.max_retries):
-            try:
-                async with self._session.post(
-                    f"{self.config.endpoint}/beacon",
-                    json=lien.to_dict(),
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 201:
-                        logger.debug(f"Beacon emitted: {event_type} (seq: {self._sequence})")
-                        return True
-                    elif response.status == 401:
-                        logger.error("Beacon authentication failed")
-                        return False
-                    else:
-                        text = await response.text()
-                        logger.warning(f"Beacon emit failed: {response.status} - {text}")
-                        
-            except asyncio.TimeoutError:
-                logger.warning(f"Beacon timeout (attempt {attempt + 1})")
-            except Exception as e:
-                logger.warning(f"Beacon emit error (attempt {attempt + 1}): {e}")
-            
-            if attempt < self.config.max_retries - 1:
-                await asyncio.sleep(self.config.retry_delay * (2 ** attempt))
+        # Only copy metadata when this call adds to the beacon-wide set
+        merged_metadata = {**self.metadata, **metadata} if metadata else self.metadata
+        if merged_metadata:
+            lien["metadata"] = merged_metadata
         
-        logger.error(f"Failed to emit beacon after {self.config.max_retries} attempts")
+        try:
+            body = _json_dumps(lien)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Beacon metadata is not JSON serializable: {e}")
+            return False
+        
+        # Batched: hand off to the flusher and return immediately
+        if self._queue is not None:
+            self._queue.put_nowait(body)
+            return True
+        
+        if await self._post("/beacon", body):
+            logger.debug(f"Beacon emitted: {event} (seq: {lien['sequence']})")
+            return True
         return False
     
     async def birth(self, metadata: Optional[Dict[str, Any]] = None):
@@ -312,7 +782,7 @@ class AgentBeacon:
         """
         death_payload = {
             "reason": reason,
-            "lifetime_seconds": time.time() - self._birth_time,
+            "lifetime_seconds": time.monotonic() - self._birth_monotonic,
             **(payload or {})
         }
         return await self.emit(EventType.DEATH, payload=death_payload)
@@ -325,8 +795,8 @@ class AgentBeacon:
             metadata: Optional status metadata (memory usage, queue depth, etc.)
         """
         hb_metadata = {
-            "active_tasks": len(self._active_tasks),
-            "uptime_seconds": time.time() - self._birth_time,
+            "active_tasks": self._active_task_count,
+            "uptime_seconds": time.monotonic() - self._birth_monotonic,
             **(metadata or {})
         }
         return await self.emit(EventType.HEARTBEAT, metadata=hb_metadata)
@@ -335,14 +805,29 @@ class AgentBeacon:
         """
         Start periodic heartbeat emission.
         
+        Ticks where the active task count and beacon metadata are unchanged
+        are skipped until ``heartbeat_max_silence`` seconds have passed since
+        the last heartbeat. Keep that below the collector's ghost threshold
+        (30s for Origin).
+        
         Args:
             interval: Seconds between heartbeats (defaults to config value)
         """
         interval = interval or self.config.heartbeat_interval
+        max_silence = self.config.heartbeat_max_silence
         
         async def heartbeat_loop():
+            last_state = None
+            last_sent = 0.0
             while not self._shutdown:
-                await self.heartbeat()
+                # Skip the emit while nothing changed, but never stay quiet
+                # long enough for the collector to mark the agent a ghost
+                state = (self._active_task_count, dict(self.metadata))
+                now = time.monotonic()
+                if state != last_state or now - last_sent >= max_silence:
+                    await self.heartbeat()
+                    last_state = state
+                    last_sent = now
                 await asyncio.sleep(interval)
         
         self._heartbeat_task = asyncio.create_task(heartbeat_loop())
@@ -367,7 +852,11 @@ class AgentBeacon:
             task_id: Unique identifier for the task
             payload: Optional task data
         """
-        self._active_tasks.add(task_id)
+        if self._active_tasks is not None:
+            self._active_tasks.add(task_id)
+            self._active_task_count = len(self._active_tasks)
+        else:
+            self._active_task_count += 1
         return await self.emit(EventType.TASK_START, task_id=task_id, payload=payload)
     
     async def task_complete(
@@ -384,7 +873,11 @@ class AgentBeacon:
             result: Task result (success, error, cancelled)
             payload: Optional result data
         """
-        self._active_tasks.discard(task_id)
+        if self._active_tasks is not None:
+            self._active_tasks.discard(task_id)
+            self._active_task_count = len(self._active_tasks)
+        else:
+            self._active_task_count = max(0, self._active_task_count - 1)
         complete_payload = {"result": result, **(payload or {})}
         return await self.emit(
             EventType.TASK_COMPLETE, 
@@ -446,7 +939,3 @@ class AgentBeacon:
         
         logger.info(f"Beacon shutdown complete for {self.agent_id}")
 
-
-# Import hmac here to avoid issues if not needed
-import hmac
-import sys
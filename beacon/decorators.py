@@ -7,6 +7,7 @@ without manually calling beacon methods.
 
 import functools
 import asyncio
+import inspect
 from typing import Callable, Optional, Any
 import logging
 
@@ -14,6 +15,18 @@ from .beacon_sdk import AgentBeacon, EventType
 
 logger = logging.getLogger(__name__)
 
+# Beacon tasks that can outlive the call that started them, e.g. when it is
+# cancelled; held here so they are not garbage-collected mid-flight
+_beacon_tasks: set = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Start a beacon coroutine as a task that is kept alive until done."""
+    task = asyncio.create_task(coro)
+    _beacon_tasks.add(task)
+    task.add_done_callback(_beacon_tasks.discard)
+    return task
+
 
 def beacon_task(
     task_id_arg: Optional[str] = None,
@@ -41,6 +54,10 @@ def beacon_task(
     def decorator(func: Callable) -> Callable:
         is_async = asyncio.iscoroutinefunction(func)
         
+        # Resolve the positional index of task_id_arg once, not per call
+        params = list(inspect.signature(func).parameters)
+        task_id_idx = params.index(task_id_arg) if task_id_arg in params else -1
+        
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             # Get beacon from self argument
@@ -50,34 +67,47 @@ def beacon_task(
             # Get task_id
             if task_id_arg and task_id_arg in kwargs:
                 task_id = kwargs[task_id_arg]
-            elif task_id_arg and len(args) > 1:
-                # Try to get from positional args
-                import inspect
-                sig = inspect.signature(func)
-                params = list(sig.parameters.keys())
-                if task_id_arg in params:
-                    idx = params.index(task_id_arg)
-                    if idx < len(args):
-                        task_id = args[idx]
-                    else:
-                        task_id = f"{func.__name__}-{id(asyncio.current_task())}"
-                else:
-                    task_id = f"{func.__name__}-{id(asyncio.current_task())}"
+            elif 0 <= task_id_idx < len(args):
+                task_id = args[task_id_idx]
             else:
                 task_id = f"{func.__name__}-{id(asyncio.current_task())}"
             
-            # Emit task_start
-            if beacon:
+            async def emit_task_start():
                 try:
-                    await beacon.task_start(task_id, {"args": str(args[1:]), "kwargs": list(kwargs.keys())})
+                    payload = None
+                    if beacon.config.include_arg_metadata:
+                        # Type names only: never repr() user data
+                        payload = {
+                            "arg_types": [type(a).__name__ for a in args[1:8]],
+                            "kwarg_keys": list(kwargs)[:16],
+                        }
+                    await beacon.task_start(task_id, payload)
                 except Exception as e:
                     logger.warning(f"Failed to emit task_start beacon: {e}")
             
+            async def emit_error(error: BaseException):
+                try:
+                    # task_start goes out first so the collector sees the
+                    # events in order
+                    await asyncio.wait((start_task,), timeout=1.0)
+                    await asyncio.wait_for(
+                        beacon.error(error, {"task_id": task_id, "function": func.__name__}),
+                        timeout=1.0
+                    )
+                except Exception as beacon_e:
+                    logger.warning(f"Failed to emit error beacon: {beacon_e!r}")
+            
+            # Emit task_start alongside the call so the beacon round-trip
+            # stays off the task's critical path; it is awaited before any
+            # later beacon so the collector sees the events in order
+            start_task = _spawn(emit_task_start()) if beacon else None
+            
             try:
                 result = await func(*args, **kwargs)
                 
                 # Emit task_complete (success)
                 if beacon:
+                    await start_task
                     try:
                         payload = {"result": "success"}
                         if emit_result:
@@ -88,13 +118,12 @@ def beacon_task(
                 
                 return result
                 
-            except Exception as e:
-                # Emit error
+            except (Exception, asyncio.CancelledError) as e:
+                # Emit error, shielded so that cancelling the caller (e.g. an
+                # outer timeout) does not cancel the error beacon with it. A
+                # cancel that arrives while waiting on it still propagates.
                 if beacon:
-                    try:
-                        await beacon.error(e, {"task_id": task_id, "function": func.__name__})
-                    except Exception as beacon_e:
-                        logger.warning(f"Failed to emit error beacon: {beacon_e}")
+                    await asyncio.shield(_spawn(emit_error(e)))
                 raise
         
         @functools.wraps(func)
@@ -117,9 +146,11 @@ def beacon_agent(
     Class decorator that adds beacon capabilities to an agent class.
     
     This decorator:
-    1. Initializes a beacon on __init__
-    2. Optionally starts heartbeat
-    3. Emits death beacon on __del__ or explicit cleanup
+    1. Initializes a beacon on __init__ (no I/O, no running loop needed)
+    2. Emits birth and optionally starts heartbeat on first use, i.e. the
+       first call to one of the class's public async methods, or an
+       explicit ``await agent.start_beacon()``
+    3. Emits death beacon on explicit cleanup
     
     Args:
         agent_type: Type of agent for beacon identification
@@ -130,7 +161,7 @@ def beacon_agent(
         >>> @beacon_agent("worker", auto_heartbeat=True)
         ... class MyWorker:
         ...     async def run(self):
-        ...         # Beacon is already initialized and heartbeating
+        ...         # Beacon was started on entry and is heartbeating
         ...         await self.do_work()
     """
     def decorator(cls):
@@ -144,17 +175,37 @@ def beacon_agent(
                 agent_type=agent_type,
                 config=kwargs.pop('beacon_config', None)
             )
+            self._beacon_started = False
+            self._beacon_start_lock = None
             
             # Call original init
             original_init(self, *args, **kwargs)
-            
-            # Emit birth and start heartbeat
-            asyncio.create_task(self._beacon.birth())
-            if auto_heartbeat:
-                asyncio.create_task(self._beacon.start_heartbeat(heartbeat_interval))
         
         cls.__init__ = new_init
         
+        async def start_beacon(self):
+            """Emit birth and start heartbeat; safe to call more than once."""
+            if self._beacon_started:
+                return
+            if self._beacon_start_lock is None:
+                self._beacon_start_lock = asyncio.Lock()
+            async with self._beacon_start_lock:
+                if self._beacon_started:
+                    return
+                await self._beacon.birth()
+                if auto_heartbeat:
+                    await self._beacon.start_heartbeat(heartbeat_interval)
+                self._beacon_started = True
+        
+        # Start the beacon on the first call to any public async method
+        for name, attr in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.isfunction(attr):
+                continue
+            if asyncio.iscoroutinefunction(attr):
+                setattr(cls, name, _start_beacon_first(attr))
+        
+        cls.start_beacon = start_beacon
+        
         # Add cleanup method
         async def cleanup(self):
             """Clean up beacon resources."""
@@ -167,6 +218,16 @@ def beacon_agent(
     return decorator
 
 
+def _start_beacon_first(method: Callable) -> Callable:
+    """Wrap an async method so the agent's beacon is started before it runs."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if not self._beacon_started:
+            await self.start_beacon()
+        return await method(self, *args, **kwargs)
+    return wrapper
+
+
 def with_beacon(func: Callable) -> Callable:
     """
     Simple decorator that ensures a beacon attribute exists on self.
@@ -6,11 +6,17 @@ For use in synchronous contexts where async/await is not available.
 
 import asyncio
 import atexit
+import concurrent.futures
+import logging
+import sys
 import threading
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Callable
 
 from .beacon_sdk import AgentBeacon, BeaconConfig, EventType
 
+logger = logging.getLogger(__name__)
+
 
 class SyncBeacon:
     """
@@ -19,6 +25,21 @@ class SyncBeacon:
     This class provides synchronous methods for emitting beacons,
     suitable for use in synchronous codebases.
     
+    Beacon methods are fire-and-forget by default: calls are queued for
+    the background loop thread, which is woken at most once per burst of
+    calls, and return True as soon as they are queued. Pass ``wait=True``
+    to block until the beacon has been sent and get its actual result.
+    
+    At most ``max_pending`` fire-and-forget calls are held while the loop
+    catches up; beyond that new beacons are dropped (returning False) and
+    counted in ``dropped_count``, as telemetry should never back up the
+    agent it reports on.
+    
+    For hot loops, set ``batch_emit`` in the BeaconConfig: the beacon then
+    posts up to ``batch_max_size`` liens per request, or whatever has
+    arrived after ``batch_max_latency_ms``. Call `flush()` to send a
+    partial batch right away.
+    
     Example:
         >>> beacon = SyncBeacon("my-agent", "worker")
         >>> beacon.start()
@@ -33,7 +54,8 @@ class SyncBeacon:
         agent_id: Optional[str] = None,
         agent_type: str = "agent",
         config: Optional[BeaconConfig] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        max_pending: int = 4096
     ):
         """
         Initialize synchronous beacon.
@@ -43,6 +65,7 @@ class SyncBeacon:
             agent_type: Type/class of agent
             config: BeaconConfig instance
             metadata: Optional metadata
+            max_pending: Fire-and-forget calls to buffer before dropping
         """
         self._async_beacon = AgentBeacon(
             agent_id=agent_id,
@@ -54,6 +77,19 @@ class SyncBeacon:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         
+        # Calls waiting for the loop thread, in submission order. One lock
+        # guards the buffer and the wakeup flag, so a submit costs a single
+        # acquire and only the empty -> non-empty transition wakes the loop.
+        self._pending: deque = deque()
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._wake_scheduled = False
+        self.dropped_count = 0
+        self._ready: Optional[asyncio.Event] = None
+        self._consumer: Optional[asyncio.Task] = None
+        # Calls made from the loop thread run as tasks; hold them until done
+        self._tasks: set = set()
+        
     def _ensure_loop(self):
         """Ensure event loop is running in background thread."""
         if self._loop is None or self._loop.is_closed():
@@ -64,18 +100,120 @@ class SyncBeacon:
     def _run_loop(self):
         """Run the event loop in background thread."""
         asyncio.set_event_loop(self._loop)
+        if sys.version_info >= (3, 12):
+            # Beacon calls mostly finish before their first real await;
+            # eager tasks run that part inline instead of a loop tick later
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+        self._ready = asyncio.Event()
+        self._consumer = self._loop.create_task(self._consume())
         self._loop.run_forever()
+        
+        self._consumer.cancel()
+        try:
+            self._loop.run_until_complete(self._consumer)
+        except asyncio.CancelledError:
+            pass
+        self._loop.close()
     
-    def _run_async(self, coro):
-        """Run an async coroutine synchronously."""
+    def _submit(
+        self,
+        func: Callable,
+        *args,
+        wait: bool = False,
+        **kwargs
+    ) -> Any:
+        """
+        Queue a beacon coroutine function to run on the loop thread.
+        
+        Returns True once queued, or the call's result when ``wait`` is set.
+        Calls made from the loop thread itself are scheduled there directly
+        and never wait, since blocking would deadlock the loop.
+        """
         self._ensure_loop()
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        if self._on_loop():
+            task = self._loop.create_task(func(*args, **kwargs))
+            self._tasks.add(task)
+            task.add_done_callback(self._task_done)
+            return True
+        future = concurrent.futures.Future() if wait else None
+        if not self._enqueue(func, args, kwargs, future):
+            return False
+        if future is None:
+            return True
         return future.result(timeout=10)  # 10 second timeout
     
+    async def _asubmit(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a beacon coroutine function on the loop thread and await it."""
+        self._ensure_loop()
+        if self._on_loop():
+            return await func(*args, **kwargs)
+        future = concurrent.futures.Future()
+        self._enqueue(func, args, kwargs, future)
+        return await asyncio.wrap_future(future)
+    
+    def _on_loop(self) -> bool:
+        """Whether the caller is running on the beacon's own loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+    
+    def _enqueue(self, func: Callable, args: tuple, kwargs: dict, future) -> bool:
+        """
+        Add a call to the pending buffer, waking the loop thread if needed.
+        
+        Calls someone is waiting on are always accepted; fire-and-forget
+        calls are dropped once the buffer is full.
+        """
+        with self._lock:
+            if future is None and len(self._pending) >= self._max_pending:
+                self.dropped_count += 1
+                if self.dropped_count == 1:
+                    logger.warning("SyncBeacon buffer full, dropping beacons")
+                return False
+            self._pending.append((func, args, kwargs, future))
+            if self._wake_scheduled:
+                return True
+            self._wake_scheduled = True
+        self._loop.call_soon_threadsafe(self._wake)
+        return True
+    
+    def _task_done(self, task: asyncio.Task):
+        """Release a finished loop-thread call and log its failure, if any."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Beacon call failed: {task.exception()}")
+    
+    def _wake(self):
+        """Loop-thread side of `_enqueue`'s wakeup."""
+        self._ready.set()
+    
+    async def _consume(self):
+        """Run queued calls in order, draining everything per wakeup."""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            # Take the whole buffer at once; anything queued after this
+            # point schedules a fresh wakeup
+            with self._lock:
+                self._wake_scheduled = False
+                batch, self._pending = self._pending, deque()
+            for func, args, kwargs, future in batch:
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    if future is None:
+                        logger.error(f"Queued beacon call {func.__name__} failed: {e}")
+                    else:
+                        future.set_exception(e)
+                else:
+                    if future is not None:
+                        future.set_result(result)
+    
     def start(self):
         """Initialize beacon and emit birth signal."""
-        self._run_async(self._async_beacon.connect())
-        self._run_async(self._async_beacon.birth())
+        self._submit(self._async_beacon.connect, wait=True)
+        self._submit(self._async_beacon.birth, wait=True)
         self._running = True
         
         # Register cleanup
@@ -85,26 +223,71 @@ class SyncBeacon:
         """Shutdown beacon and emit death signal."""
         if not self._running:
             return
-        
-        self._run_async(self._async_beacon.shutdown(reason))
         self._running = False
         
-        if self._loop and not self._loop.is_closed():
+        # One queued call, behind any pending beacons so they are sent
+        # first, shuts the beacon down and stops the loop
+        try:
+            self._submit(self._finalize, reason, wait=True)
+        except concurrent.futures.TimeoutError:
+            logger.warning("Beacon shutdown timed out, stopping loop")
             self._loop.call_soon_threadsafe(self._loop.stop)
         
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
     
+    def flush(self):
+        """Send all queued calls and any partially filled batch now."""
+        self._submit(self._async_beacon.flush, wait=True)
+    
+    async def _finalize(self, reason: str):
+        """Shut the beacon down and stop the background loop."""
+        try:
+            await self._async_beacon.shutdown(reason)
+        finally:
+            await self._loop.shutdown_asyncgens()
+            self._loop.stop()
+    
     def emit(
         self,
         event_type: str,
         payload: Optional[Dict] = None,
         task_id: Optional[str] = None,
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        wait: bool = False
     ) -> bool:
         """
         Emit a beacon synchronously.
         
+        Args:
+            event_type: Type of event
+            payload: Optional payload data
+            task_id: Optional task identifier
+            metadata: Optional metadata
+            wait: Block until the beacon is sent and return its result
+            
+        Returns:
+            True if queued (or, with ``wait``, if successful)
+        """
+        return self._submit(
+            self._async_beacon.emit,
+            event_type=event_type,
+            payload=payload,
+            task_id=task_id,
+            metadata=metadata,
+            wait=wait
+        )
+    
+    async def aemit(
+        self,
+        event_type: str,
+        payload: Optional[Dict] = None,
+        task_id: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> bool:
+        """
+        Emit a beacon from async code without blocking the caller's loop.
+        
         Args:
             event_type: Type of event
             payload: Optional payload data
@@ -114,42 +297,61 @@ class SyncBeacon:
         Returns:
             True if successful
         """
-        return self._run_async(self._async_beacon.emit(
+        return await self._asubmit(
+            self._async_beacon.emit,
             event_type=event_type,
             payload=payload,
             task_id=task_id,
             metadata=metadata
-        ))
+        )
     
-    def heartbeat(self, metadata: Optional[Dict] = None) -> bool:
+    def heartbeat(self, metadata: Optional[Dict] = None, wait: bool = False) -> bool:
         """Emit a heartbeat beacon."""
-        return self._run_async(self._async_beacon.heartbeat(metadata))
+        return self._submit(self._async_beacon.heartbeat, metadata, wait=wait)
     
-    def task_start(self, task_id: str, payload: Optional[Dict] = None) -> bool:
+    def task_start(
+        self,
+        task_id: str,
+        payload: Optional[Dict] = None,
+        wait: bool = False
+    ) -> bool:
         """Emit a task_start beacon."""
-        return self._run_async(self._async_beacon.task_start(task_id, payload))
+        return self._submit(self._async_beacon.task_start, task_id, payload, wait=wait)
     
     def task_complete(
         self, 
         task_id: str, 
         result: str = "success",
-        payload: Optional[Dict] = None
+        payload: Optional[Dict] = None,
+        wait: bool = False
     ) -> bool:
         """Emit a task_complete beacon."""
-        return self._run_async(self._async_beacon.task_complete(task_id, result, payload))
+        return self._submit(
+            self._async_beacon.task_complete, task_id, result, payload, wait=wait
+        )
     
-    def handoff(self, target_agent_id: str, context: Optional[Dict] = None) -> bool:
+    def handoff(
+        self,
+        target_agent_id: str,
+        context: Optional[Dict] = None,
+        wait: bool = False
+    ) -> bool:
         """Emit a handoff beacon."""
-        return self._run_async(self._async_beacon.handoff(target_agent_id, context))
+        return self._submit(self._async_beacon.handoff, target_agent_id, context, wait=wait)
     
-    def error(self, error: Exception, context: Optional[Dict] = None) -> bool:
+    def error(
+        self,
+        error: Exception,
+        context: Optional[Dict] = None,
+        wait: bool = False
+    ) -> bool:
         """Emit an error beacon."""
-        return self._run_async(self._async_beacon.error(error, context))
+        return self._submit(self._async_beacon.error, error, context, wait=wait)
     
     def start_heartbeat(self, interval: int = 30):
         """Start periodic heartbeat."""
-        self._run_async(self._async_beacon.start_heartbeat(interval))
+        self._submit(self._async_beacon.start_heartbeat, interval, wait=True)
     
     def stop_heartbeat(self):
         """Stop periodic heartbeat."""
-        self._run_async(self._async_beacon.stop_heartbeat())
+        self._submit(self._async_beacon.stop_heartbeat, wait=True)
@@ -4,16 +4,65 @@ Discovers AI agents from GitHub repositories
 """
 
 import asyncio
+import base64
 import hashlib
 import json
 import os
-from dataclasses import dataclass, asdict
-from datetime import datetime
-from typing import List, Optional, Set
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, List, Mapping, Optional, Set, Tuple
 from enum import Enum
 
 import aiohttp
 
+# Optional fast JSON support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional HTTP/2 client (GitHubAgentCollector(http2=True))
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing ``rate`` acquisitions per ``period`` seconds.
+    
+    Up to ``rate`` acquisitions go through immediately; after that callers
+    wait for tokens to refill at a steady rate.
+    """
+    
+    def __init__(self, rate: int, period: float):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+        
+    async def acquire(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._updated is not None:
+                refill = (now - self._updated) * self.rate / self.period
+                self._tokens = min(self.rate, self._tokens + refill)
+            self._updated = now
+            
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+                self._tokens = 1.0
+                self._updated = loop.time()
+            self._tokens -= 1
+
 
 class AgentType(Enum):
     CHATBOT = "chatbot"
@@ -24,7 +73,7 @@ class AgentType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSignature:
     agent_id: str
     name: str
@@ -36,10 +85,17 @@ class AgentSignature:
     metadata: dict
     
     def to_dict(self):
-        data = asdict(self)
-        data['agent_type'] = self.agent_type.value
-        data['detected_at'] = self.detected_at.isoformat()
-        return data
+        # Built by hand: asdict() deep-copies every nested container
+        return {
+            "agent_id": self.agent_id,
+            "name": self.name,
+            "confidence_score": self.confidence_score,
+            "agent_type": self.agent_type.value,
+            "capabilities": list(self.capabilities),
+            "source_repo": self.source_repo,
+            "detected_at": self.detected_at.isoformat(),
+            "metadata": dict(self.metadata),
+        }
 
 
 class GitHubAgentCollector:
@@ -79,11 +135,53 @@ class GitHubAgentCollector:
         ]
     }
     
-    def __init__(self, github_token: Optional[str] = None):
+    # Description/name keywords, each worth 0.2
+    METADATA_KEYWORDS = [
+        "agent", "autonomous", "ai assistant", "bot framework",
+        "llm agent", "ai agent", "automation"
+    ]
+    
+    # README keywords and their weights; matches become capabilities
+    README_PATTERNS = [
+        ("autonomous", 0.2),
+        ("llm", 0.15),
+        ("openai", 0.1),
+        ("agent framework", 0.25),
+        ("tools", 0.1),
+        ("orchestration", 0.2),
+        ("multi-agent", 0.25),
+    ]
+    
+    # Exact top-level file names checked by _analyze_code
+    _CONFIG_FILES = frozenset(f.lower() for f in AGENT_INDICATORS["config_files"])
+    _MANIFEST_FILES = frozenset({"requirements.txt", "package.json", "pyproject.toml"})
+    
+    # Capability markers for _classify_agent_type
+    _AUTONOMOUS_MARKERS = frozenset({"autonomous_operation", "autonomous"})
+    _AGENT_MARKERS = frozenset({"explicit_agent", "agent"})
+    
+    # READMEs are scanned as raw bytes: the keywords are ASCII, so
+    # bytes.lower() is enough and the text never needs decoding
+    _README_NEEDLES = [(p, p.encode(), w) for p, w in README_PATTERNS]
+    
+    # Repositories analyzed concurrently
+    MAX_CONCURRENT_ANALYSES = 20
+    
+    # Search queries issued concurrently
+    MAX_CONCURRENT_SEARCHES = 5
+    
+    def __init__(self, github_token: Optional[str] = None, http2: bool = False):
         self.token = github_token or os.getenv("GITHUB_TOKEN")
         self.base_url = "https://api.github.com"
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[Any] = None  # aiohttp.ClientSession or httpx.AsyncClient
+        self.http2 = http2 and HTTPX_AVAILABLE
+        if http2 and not HTTPX_AVAILABLE:
+            print("⚠️  HTTP/2 requires 'httpx[http2]'. Install with: pip install 'httpx[http2]'")
         self.discovered_agents: List[AgentSignature] = []
+        # Reference time for the current collect() run, taken once
+        self._analysis_now: Optional[datetime] = None
+        # GitHub's search API allows 30 requests/minute with a token, 10 without
+        self._search_limiter = _RateLimiter(30 if self.token else 10, 60)
         
     async def __aenter__(self):
         headers = {
@@ -92,31 +190,79 @@ class GitHubAgentCollector:
         }
         if self.token:
             headers["Authorization"] = f"token {self.token}"
-            
-        self.session = aiohttp.ClientSession(headers=headers)
+        
+        # One client per collector; run several collect() calls inside the
+        # same context to reuse its connections
+        if self.http2:
+            # Concurrent requests to api.github.com multiplex over one
+            # connection instead of each needing their own handshake
+            self.session = httpx.AsyncClient(
+                headers=headers,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=120)
+                )
+            )
+        else:
+            # Everything goes to api.github.com: a few keep-alive sockets
+            # beat dozens of fresh handshakes, and stay clear of GitHub's
+            # secondary rate limits
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            self.session = aiohttp.ClientSession(headers=headers, connector=connector)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
-            await self.session.close()
+            if self.http2:
+                await self.session.aclose()
+            else:
+                await self.session.close()
+            
+    async def _get(
+        self, url: str, params: Optional[dict] = None
+    ) -> Tuple[int, Any, Mapping[str, str]]:
+        """GET a GitHub API URL, returning the status, JSON body (on 200) and headers"""
+        if self.http2:
+            resp = await self.session.get(url, params=params)
+            if resp.status_code != 200:
+                return resp.status_code, None, resp.headers
+            data = orjson.loads(resp.content) if ORJSON_AVAILABLE else resp.json()
+            return 200, data, resp.headers
+        
+        async with self.session.get(url, params=params) as resp:
+            if resp.status != 200:
+                return resp.status, None, resp.headers
+            if ORJSON_AVAILABLE:
+                return 200, orjson.loads(await resp.read()), resp.headers
+            return 200, await resp.json(), resp.headers
             
     async def collect(self, max_repos: int = 100) -> List[AgentSignature]:
         """Main collection method"""
         print(f"🔍 Starting GitHub agent discovery (max {max_repos} repos)...")
+        self._analysis_now = datetime.now(timezone.utc)
         
         # Search for repositories
         repos = await self._search_repositories(max_repos)
         print(f"📦 Found {len(repos)} potential repositories")
         
-        # Analyze each repository
-        for repo in repos:
-            try:
-                agent = await self._analyze_repository(repo)
-                if agent:
-                    self.discovered_agents.append(agent)
-                    print(f"  ✅ Found agent: {agent.name} (confidence: {agent.confidence_score:.2f})")
-            except Exception as e:
-                print(f"  ⚠️  Error analyzing {repo['full_name']}: {e}")
+        # Analyze repositories concurrently, keeping the search order
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYSES)
+        results = await asyncio.gather(
+            *(self._bounded_analyze(sem, repo) for repo in repos),
+            return_exceptions=True
+        )
+        for repo, agent in zip(repos, results):
+            if isinstance(agent, Exception):
+                print(f"  ⚠️  Error analyzing {repo['full_name']}: {agent}")
+            elif agent:
+                self.discovered_agents.append(agent)
+                print(f"  ✅ Found agent: {agent.name} (confidence: {agent.confidence_score:.2f})")
                 
         print(f"\n🎯 Total agents discovered: {len(self.discovered_agents)}")
         return self.discovered_agents
@@ -125,76 +271,106 @@ class GitHubAgentCollector:
         """Search GitHub for agent-related repositories"""
         repos = []
         seen = set()
+        queries = self.SEARCH_QUERIES
         
-        for query in self.SEARCH_QUERIES:
+        # Run queries a wave at a time, stopping once enough repos are found;
+        # results are merged in query order so the output is deterministic
+        for i in range(0, len(queries), self.MAX_CONCURRENT_SEARCHES):
             if len(repos) >= max_results:
                 break
-                
-            url = f"{self.base_url}/search/repositories"
-            params = {
-                "q": query,
-                "sort": "updated",
-                "order": "desc",
-                "per_page": min(30, max_results - len(repos))
-            }
             
-            try:
-                async with self.session.get(url, params=params) as resp:
-                    if resp.status == 403:
-                        print("⚠️  Rate limit hit, waiting...")
-                        await asyncio.sleep(60)
-                        continue
-                        
-                    data = await resp.json()
-                    for repo in data.get("items", []):
-                        if repo["full_name"] not in seen:
-                            seen.add(repo["full_name"])
-                            repos.append(repo)
-                            
-                    await asyncio.sleep(1)  # Rate limiting
-                    
-            except Exception as e:
-                print(f"Search error for query '{query}': {e}")
+            per_page = min(30, max_results - len(repos))
+            wave = queries[i:i + self.MAX_CONCURRENT_SEARCHES]
+            results = await asyncio.gather(
+                *(self._search_query(query, per_page) for query in wave)
+            )
+            for items in results:
+                for repo in items:
+                    if repo["full_name"] not in seen:
+                        seen.add(repo["full_name"])
+                        repos.append(repo)
                 
         return repos[:max_results]
     
+    async def _search_query(self, query: str, per_page: int) -> List[dict]:
+        """Run one repository search, waiting out a rate limit once if hit"""
+        url = f"{self.base_url}/search/repositories"
+        params = {
+            "q": query,
+            "sort": "updated",
+            "order": "desc",
+            "per_page": per_page
+        }
+        
+        try:
+            for attempt in range(2):
+                await self._search_limiter.acquire()
+                status, data, headers = await self._get(url, params=params)
+                if status != 403:
+                    return (data or {}).get("items", [])
+                
+                if attempt == 0:
+                    # Sleep until the window resets rather than a fixed minute
+                    reset = headers.get("X-RateLimit-Reset")
+                    delay = max(0.0, int(reset) - time.time()) + 1 if reset else 60
+                    print(f"⚠️  Rate limit hit, waiting {delay:.0f}s...")
+                    await asyncio.sleep(delay)
+                    
+        except Exception as e:
+            print(f"Search error for query '{query}': {e}")
+            
+        return []
+    
+    async def _bounded_analyze(
+        self, sem: asyncio.Semaphore, repo: dict
+    ) -> Optional[AgentSignature]:
+        """Analyze a repository while holding a concurrency slot"""
+        async with sem:
+            return await self._analyze_repository(repo)
+    
     async def _analyze_repository(self, repo: dict) -> Optional[AgentSignature]:
         """Analyze a repository to determine if it contains an agent"""
         signals = []
         capabilities = []
         
+        # Signals 2 and 3 are independent requests; start both before the
+        # local metadata analysis so their round trips overlap
+        readme_task = asyncio.create_task(self._analyze_readme(repo))
+        code_task = asyncio.create_task(self._analyze_code(repo))
+        
         # Signal 1: Repository metadata
         score, caps = self._analyze_metadata(repo)
         signals.append(("metadata", score))
         capabilities.extend(caps)
         
-        # Signal 2: README content
-        score, caps = await self._analyze_readme(repo)
-        signals.append(("readme", score))
-        capabilities.extend(caps)
-        
-        # Signal 3: Code analysis
-        score, caps = await self._analyze_code(repo)
-        signals.append(("code", score))
-        capabilities.extend(caps)
+        # Signal 2: README content, Signal 3: Code analysis
+        readme, code = await asyncio.gather(readme_task, code_task)
+        for name, (score, caps) in (("readme", readme), ("code", code)):
+            signals.append((name, score))
+            capabilities.extend(caps)
         
         # Calculate overall confidence
         confidence = sum(score for _, score in signals) / len(signals)
         
         if confidence > 0.5:  # Threshold for agent detection
             # Generate unique ID
-            agent_id = hashlib.sha256(
-                f"{repo['full_name']}:{repo['created_at']}".encode()
-            ).hexdigest()[:16]
+            # Same digest as hashing "full_name:created_at", without
+            # building the joined string first
+            h = hashlib.blake2b(digest_size=8)
+            h.update(repo['full_name'].encode())
+            h.update(b":")
+            h.update(repo['created_at'].encode())
+            agent_id = h.hexdigest()
             
+            unique_caps = frozenset(capabilities)
             return AgentSignature(
                 agent_id=agent_id,
                 name=repo['name'],
                 confidence_score=confidence,
-                agent_type=self._classify_agent_type(capabilities),
-                capabilities=list(set(capabilities)),
+                agent_type=self._classify_agent_type(unique_caps),
+                capabilities=list(unique_caps),
                 source_repo=repo['html_url'],
-                detected_at=datetime.utcnow(),
+                detected_at=self._run_time().replace(tzinfo=None),  # Naive UTC, as before
                 metadata={
                     "stars": repo.get("stargazers_count", 0),
                     "language": repo.get("language"),
@@ -205,6 +381,10 @@ class GitHubAgentCollector:
         
         return None
     
+    def _run_time(self) -> datetime:
+        """Aware UTC time of the current run (or now, outside collect())"""
+        return self._analysis_now or datetime.now(timezone.utc)
+    
     def _analyze_metadata(self, repo: dict) -> tuple[float, List[str]]:
         """Analyze repository metadata for agent indicators"""
         score = 0.0
@@ -214,13 +394,13 @@ class GitHubAgentCollector:
         desc = (repo.get("description") or "").lower()
         name = repo.get("name", "").lower()
         
-        agent_keywords = [
-            "agent", "autonomous", "ai assistant", "bot framework",
-            "llm agent", "ai agent", "automation"
-        ]
-        
-        for keyword in agent_keywords:
-            if keyword in desc or keyword in name:
+        # Substring search rejects non-matching text at C speed (CPython's
+        # fastsearch skips ahead using a bloom mask of the needle), so most
+        # repos cost a few fast misses. The newline keeps matches from
+        # spanning both fields.
+        text = f"{desc}\n{name}"
+        for keyword in self.METADATA_KEYWORDS:
+            if keyword in text:
                 score += 0.2
                 
         # Check topics
@@ -234,8 +414,9 @@ class GitHubAgentCollector:
             
         # Recent activity suggests active development
         if repo.get("pushed_at"):
+            # Python < 3.11 cannot parse the trailing "Z" itself
             last_push = datetime.fromisoformat(repo["pushed_at"].replace("Z", "+00:00"))
-            days_since = (datetime.now().replace(tzinfo=last_push.tzinfo) - last_push).days
+            days_since = (self._run_time() - last_push).days
             if days_since < 30:
                 score += 0.1
                 
@@ -248,33 +429,21 @@ class GitHubAgentCollector:
         
         try:
             url = f"{self.base_url}/repos/{repo['full_name']}/readme"
-            async with self.session.get(url) as resp:
-                if resp.status != 200:
-                    return score, capabilities
-                    
-                data = await resp.json()
-                import base64
-                content = base64.b64decode(data["content"]).decode("utf-8", errors="ignore").lower()
+            status, data, _ = await self._get(url)
+            if status != 200:
+                return score, capabilities
                 
-                # Check for agent patterns
-                patterns = [
-                    ("autonomous", 0.2),
-                    ("llm", 0.15),
-                    ("openai", 0.1),
-                    ("agent framework", 0.25),
-                    ("tools", 0.1),
-                    ("orchestration", 0.2),
-                    ("multi-agent", 0.25),
-                ]
-                
-                for pattern, weight in patterns:
-                    if pattern in content:
-                        score += weight
-                        capabilities.append(pattern)
-                        
-                # Check for code examples
-                if "```" in content:
-                    score += 0.1
+            content = base64.b64decode(data["content"]).lower()
+            
+            # Check for agent patterns
+            for pattern, needle, weight in self._README_NEEDLES:
+                if needle in content:
+                    score += weight
+                    capabilities.append(pattern)
+                    
+            # Check for code examples
+            if b"```" in content:
+                score += 0.1
                     
         except Exception as e:
             pass
@@ -289,46 +458,41 @@ class GitHubAgentCollector:
         try:
             # Get repository contents
             url = f"{self.base_url}/repos/{repo['full_name']}/contents"
-            async with self.session.get(url) as resp:
-                if resp.status != 200:
-                    return score, capabilities
-                    
-                contents = await resp.json()
-                if not isinstance(contents, list):
-                    return score, capabilities
+            status, contents, _ = await self._get(url)
+            if status != 200:
+                return score, capabilities
                 
-                # Check for agent indicator files
-                for item in contents:
-                    name = item.get("name", "").lower()
-                    
-                    for indicator_file in self.AGENT_INDICATORS["config_files"]:
-                        if indicator_file in name:
-                            score += 0.3
-                            capabilities.append("configuration_driven")
-                            
-                # Check for main framework files
-                for item in contents:
-                    name = item.get("name", "").lower()
-                    if name in ["requirements.txt", "package.json", "pyproject.toml"]:
-                        # Would analyze dependencies here
-                        score += 0.1
+            if not isinstance(contents, list):
+                return score, capabilities
+            
+            names = {item.get("name", "").lower() for item in contents}
+            
+            # Check for agent indicator files
+            config_hits = names & self._CONFIG_FILES
+            if config_hits:
+                score += 0.3 * len(config_hits)
+                capabilities.append("configuration_driven")
+                
+            # Check for main framework files
+            # Would analyze dependencies here
+            score += 0.1 * len(names & self._MANIFEST_FILES)
                         
         except Exception as e:
             pass
             
         return min(score, 1.0), capabilities
     
-    def _classify_agent_type(self, capabilities: List[str]) -> AgentType:
+    def _classify_agent_type(self, capabilities: Iterable[str]) -> AgentType:
         """Classify the type of agent based on capabilities"""
-        caps_lower = [c.lower() for c in capabilities]
+        caps = frozenset(map(str.lower, capabilities))
         
-        if "autonomous_operation" in caps_lower or "autonomous" in caps_lower:
+        if not caps.isdisjoint(self._AUTONOMOUS_MARKERS):
             return AgentType.AUTONOMOUS
-        elif "explicit_agent" in caps_lower or "agent" in caps_lower:
-            if "orchestration" in caps_lower:
+        elif not caps.isdisjoint(self._AGENT_MARKERS):
+            if "orchestration" in caps:
                 return AgentType.TOOL
             return AgentType.CODE_AGENT
-        elif "multi-agent" in caps_lower:
+        elif "multi-agent" in caps:
             return AgentType.TOOL
         else:
             return AgentType.UNKNOWN
@@ -341,8 +505,8 @@ class StorageBackend:
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
-    def save(self, agents: List[AgentSignature]):
-        """Save agents to JSON file"""
+    async def save(self, agents: List[AgentSignature]) -> str:
+        """Save agents to JSON file, writing from a worker thread"""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         filename = f"agents_{timestamp}.json"
         filepath = os.path.join(self.output_dir, filename)
@@ -350,18 +514,34 @@ class StorageBackend:
         data = {
             "collection_timestamp": datetime.utcnow().isoformat(),
             "total_agents": len(agents),
-            "agents": [agent.to_dict() for agent in agents]
         }
         
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        # Serializing and writing a large collection would stall the loop
+        await asyncio.to_thread(self._write, filepath, data, agents)
             
         print(f"💾 Saved {len(agents)} agents to {filepath}")
         return filepath
+    
+    def _write(self, filepath: str, data: dict, agents: List[AgentSignature]):
+        """Serialize and write a collection file (blocking)"""
+        if ORJSON_AVAILABLE:
+            # orjson serializes the dataclasses, enums and datetimes itself,
+            # without the deep copy asdict() makes
+            data["agents"] = agents
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            data["agents"] = [agent.to_dict() for agent in agents]
+            with open(filepath, "w") as f:
+                json.dump(data, f, indent=2)
 
 
 async def main():
     """Main entry point"""
+    if sys.version_info >= (3, 12):
+        # Most analysis tasks do some work before their first request
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     print("=" * 60)
     print("🤖 GitHub Agent Collector")
     print("=" * 60)
@@ -377,7 +557,7 @@ async def main():
     
     # Save results
     storage = StorageBackend()
-    filepath = storage.save(agents)
+    filepath = await storage.save(agents)
     
     # Summary
     print("\n" + "=" * 60)
@@ -14,28 +14,68 @@ Enhancements in v2.0:
 import asyncio
 import json
 import hashlib
+import math
 import re
 import csv
 import io
 import base64
 import argparse
 import sys
-from dataclasses import dataclass, asdict, field
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import List, Optional, Set, Dict, Any, Tuple
 from enum import Enum
-from collections import defaultdict
+from collections import Counter
 import aiohttp
 
 # Optional DNS support
 try:
-    import dns.resolver
+    import dns.asyncresolver
     from dns.exception import DNSException
     DNS_AVAILABLE = True
 except ImportError:
     DNS_AVAILABLE = False
     DNSException = Exception
 
+# Optional fast JSON support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Optional c-ares resolver for the scanner's HTTP session
+try:
+    import aiodns  # noqa: F401 - used through aiohttp.AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime (datetime.utcnow is deprecated)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _signature_id(key: str) -> str:
+    """16-hex-char display ID for a discovered endpoint, repo or host"""
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _iter_strings(obj: Any):
+    """Yield the string leaves of nested dicts, lists and tuples"""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+
 
 class OpenClawSignatureType(Enum):
     GATEWAY = "gateway"           # OpenClaw gateway instances
@@ -47,7 +87,7 @@ class OpenClawSignatureType(Enum):
     CONTAINER = "container"       # Docker/container deployments
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionFactor:
     """Individual detection factor for multi-factor scoring"""
     factor_type: str
@@ -56,7 +96,7 @@ class DetectionFactor:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenClawSignature:
     signature_id: str
     signature_type: OpenClawSignatureType
@@ -70,19 +110,28 @@ class OpenClawSignature:
     detection_factors: List[DetectionFactor] = field(default_factory=list)
     
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['signature_type'] = self.signature_type.value
-        data['detected_at'] = self.detected_at.isoformat()
-        data['detection_factors'] = [
-            {
-                'factor_type': f.factor_type,
-                'weight': f.weight,
-                'detected': f.detected,
-                'details': f.details
-            }
-            for f in self.detection_factors
-        ]
-        return data
+        # Built by hand rather than with asdict(), which deep-copies every
+        # nested list and dict only for the result to be serialized
+        return {
+            'signature_id': self.signature_id,
+            'signature_type': self.signature_type.value,
+            'confidence_score': self.confidence_score,
+            'platform': self.platform,
+            'detected_at': self.detected_at.isoformat(),
+            'endpoint': self.endpoint,
+            'version_hint': self.version_hint,
+            'capabilities': self.capabilities,
+            'metadata': self.metadata,
+            'detection_factors': [
+                {
+                    'factor_type': f.factor_type,
+                    'weight': f.weight,
+                    'detected': f.detected,
+                    'details': f.details
+                }
+                for f in self.detection_factors
+            ],
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'OpenClawSignature':
@@ -137,6 +186,19 @@ class ConfidenceScorer:
         r"error.*page",
     ]
     
+    # Compiled false positive patterns, each paired with the literal it
+    # starts with; a pattern can only match content containing it, so the
+    # regex runs only after a cheap substring test hits
+    _FP_CHECKS = [
+        (re.match(r"\w+", p).group(), re.compile(p)) for p in FALSE_POSITIVE_PATTERNS
+    ]
+    
+    # Log prior odds and log likelihood ratios, so calculate_confidence sums
+    # instead of multiplying
+    _LOG_PRIOR_ODDS = math.log(PRIOR_PROBABILITY / (1 - PRIOR_PROBABILITY))
+    _LOG_LR = {name: math.log(config["lr_true"]) for name, config in FACTOR_CONFIG.items()}
+    _DEFAULT_LOG_LR = math.log(10)
+    
     def __init__(self):
         self.false_positive_penalty = 0.3
     
@@ -148,24 +210,21 @@ class ConfidenceScorer:
         if not factors:
             return 0.0, ["No detection factors"]
         
-        # Start with prior odds
-        prior_odds = self.PRIOR_PROBABILITY / (1 - self.PRIOR_PROBABILITY)
-        current_odds = prior_odds
+        # Start with prior odds; work in log space so many strong factors
+        # can't overflow the odds to inf (inf / (1 + inf) is nan)
+        log_odds = self._LOG_PRIOR_ODDS
         reasoning = []
         
         for factor in factors:
             if not factor.detected:
                 continue
             
-            config = self.FACTOR_CONFIG.get(factor.factor_type, {})
-            lr = config.get("lr_true", 10)
-            
             # Update odds using Bayes' theorem
-            current_odds *= lr
+            log_odds += self._LOG_LR.get(factor.factor_type, self._DEFAULT_LOG_LR)
             reasoning.append(f"{factor.factor_type}: +{factor.weight:.2f}")
         
         # Convert odds back to probability
-        confidence = current_odds / (1 + current_odds)
+        confidence = 1 / (1 + math.exp(-log_odds))
         
         # Apply penalties for false positive indicators
         for factor in factors:
@@ -180,10 +239,11 @@ class ConfidenceScorer:
     
     def _check_false_positive_indicators(self, details: Dict) -> bool:
         """Check if detection has false positive indicators"""
-        content = str(details).lower()
-        for pattern in self.FALSE_POSITIVE_PATTERNS:
-            if re.search(pattern, content):
-                return True
+        for value in _iter_strings(details):
+            content = value.lower()
+            for literal, regex in self._FP_CHECKS:
+                if literal in content and regex.search(content):
+                    return True
         return False
     
     def get_confidence_level(self, score: float) -> str:
@@ -296,6 +356,28 @@ class OpenClawScanner:
         ],
     }
     
+    # Body patterns probe_endpoint checks on every response, compiled once.
+    # Kept as separate searches: a single alternation reports only one
+    # pattern per match position (the telegram and discord "channels"
+    # patterns share theirs) and measured ~10x slower on large HTML bodies.
+    # Compiled lowercased and matched against the lowercased body, which is
+    # cheaper than case-folding in every IGNORECASE search; the patterns only
+    # use lowercase escapes (\s, \d), so lowercasing them is safe.
+    _BODY_PATTERNS = [
+        (p, re.compile(p.lower())) for p in SIGNATURE_PATTERNS["response_body"]
+    ]
+    _HEALTH_PATTERNS = [
+        (p, re.compile(p.lower())) for p in SIGNATURE_PATTERNS["health_signatures"]
+    ]
+    _STATUS_PATTERNS = [
+        (p, re.compile(p.lower())) for p in SIGNATURE_PATTERNS["status_signatures"]
+    ]
+    # Every body pattern starts with a quoted JSON key; a body containing
+    # none of them can skip the body regexes entirely
+    _BODY_KEYS = tuple(dict.fromkeys(
+        re.match(r'"\w+"', p).group().lower() for p in SIGNATURE_PATTERNS["response_body"]
+    ))
+    
     # Domain patterns for DNS scanning
     DOMAIN_PATTERNS = [
         "openclaw",
@@ -311,18 +393,40 @@ class OpenClawScanner:
         r"_openclaw.",
     ]
     
+    # Unauthenticated GitHub search allows 10 requests/minute, so the repo
+    # queries fit in one burst; cap how many are in flight at once
+    MAX_CONCURRENT_SEARCHES = 3
+    MAX_CONCURRENT_PROBES = 50
+    MAX_CONCURRENT_DNS_QUERIES = 64
+    MAX_PROBE_BODY_BYTES = 256 * 1024
+    # Header-only confidence at which probe_endpoint skips reading the body
+    BODY_SKIP_CONFIDENCE = 0.8
+    
     def __init__(self, api_keys: Optional[Dict[str, str]] = None):
         self.discovered: List[OpenClawSignature] = []
         self.session: Optional[aiohttp.ClientSession] = None
         self.scorer = ConfidenceScorer()
         self.api_keys = api_keys or {}
+        self._txt_cache: Dict[str, List[str]] = {}
+        self._discovered_index: Dict[str, int] = {}
         
     async def __aenter__(self):
         self.session = aiohttp.ClientSession(
             headers={
                 "User-Agent": "AgentMonitoringSystem/2.0 (Research Project)"
             },
-            timeout=aiohttp.ClientTimeout(total=15)
+            timeout=aiohttp.ClientTimeout(total=15),
+            # One pooled connector for every scan: API hosts (GitHub, Docker
+            # Hub, Shodan, Censys) are hit repeatedly, so keep their
+            # connections alive between the spaced-out requests instead of
+            # redoing the TLS handshake
+            connector=aiohttp.TCPConnector(
+                limit=self.MAX_CONCURRENT_PROBES,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+            ),
         )
         return self
         
@@ -351,94 +455,124 @@ class OpenClawScanner:
         print(f"\n🎯 Total OpenClaw signatures discovered: {len(self.discovered)}")
         return self.discovered
     
+    def _record(self, sig: OpenClawSignature) -> bool:
+        """
+        Add a signature to self.discovered unless one with the same ID is
+        already there; returns whether it was new. A duplicate with higher
+        confidence replaces the earlier entry in place.
+        """
+        index = self._discovered_index.get(sig.signature_id)
+        if index is None:
+            self._discovered_index[sig.signature_id] = len(self.discovered)
+            self.discovered.append(sig)
+            return True
+        if sig.confidence_score > self.discovered[index].confidence_score:
+            self.discovered[index] = sig
+        return False
+    
     async def _scan_github_repos(self):
         """Scan GitHub for OpenClaw-related repositories"""
         print("📦 Scanning GitHub for OpenClaw repos...")
         
+        # Alternatives are OR-merged (GitHub allows up to five operators per
+        # query) so each needs one request; results overlap, so repos are
+        # deduplicated by URL across queries
         queries = [
-            "openclaw",
-            "clawbot",
-            "filename:openclaw.json",
-            "filename:clawbot.json",
-            "filename:openclaw.yaml",
-            "filename:openclaw.yml",
+            "openclaw OR clawbot",
+            "filename:openclaw.json OR filename:clawbot.json"
+            " OR filename:openclaw.yaml OR filename:openclaw.yml",
             '"gateway" "openclaw"',
             '"subagent" "telegram" "discord"',
             '"openclaw" "docker"',
         ]
         
-        for query in queries:
-            try:
-                url = "https://api.github.com/search/repositories"
-                params = {"q": query, "per_page": 30}
-                
-                async with self.session.get(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for repo in data.get("items", []):
-                            factors, confidence = self._analyze_repo_for_openclaw(repo)
-                            if confidence > 0.5:
-                                sig = OpenClawSignature(
-                                    signature_id=hashlib.sha256(
-                                        repo["html_url"].encode()
-                                    ).hexdigest()[:16],
-                                    signature_type=OpenClawSignatureType.GATEWAY,
-                                    confidence_score=confidence,
-                                    platform="github",
-                                    detected_at=datetime.utcnow(),
-                                    endpoint=repo["html_url"],
-                                    version_hint=None,
-                                    capabilities=["repository", "public_code"],
-                                    metadata={
-                                        "stars": repo.get("stargazers_count"),
-                                        "language": repo.get("language"),
-                                        "description": repo.get("description"),
-                                        "query": query,
-                                    },
-                                    detection_factors=factors
-                                )
-                                self.discovered.append(sig)
-                                level = self.scorer.get_confidence_level(confidence)
-                                print(f"  ✅ Found: {repo['full_name']} ({level}: {confidence:.2f})")
-                                
-                await asyncio.sleep(1)  # Rate limiting
-                
-            except Exception as e:
-                print(f"  ⚠️  GitHub scan error: {e}")
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+        seen: Set[str] = set()
+        await asyncio.gather(
+            *(self._search_github_repos(sem, query, seen) for query in queries)
+        )
+    
+    async def _search_github_repos(self, sem: asyncio.Semaphore, query: str,
+                                   seen: Set[str]):
+        """Run one repository search query and record repos not yet seen"""
+        try:
+            url = "https://api.github.com/search/repositories"
+            params = {"q": query, "per_page": 100}
+            
+            async with sem, self.session.get(url, params=params) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=_json_loads)
+                    now = _utcnow()  # one timestamp per response
+                    found = []
+                    for repo in data.get("items", []):
+                        if repo["html_url"] in seen:
+                            continue
+                        seen.add(repo["html_url"])
+                        factors, confidence = self._analyze_repo_for_openclaw(repo)
+                        if confidence > 0.5:
+                            sig = OpenClawSignature(
+                                signature_id=_signature_id(repo["html_url"]),
+                                signature_type=OpenClawSignatureType.GATEWAY,
+                                confidence_score=confidence,
+                                platform="github",
+                                detected_at=now,
+                                endpoint=repo["html_url"],
+                                version_hint=None,
+                                capabilities=["repository", "public_code"],
+                                metadata={
+                                    "stars": repo.get("stargazers_count"),
+                                    "language": repo.get("language"),
+                                    "description": repo.get("description"),
+                                    "query": query,
+                                },
+                                detection_factors=factors
+                            )
+                            if not self._record(sig):
+                                continue
+                            level = self.scorer.get_confidence_level(confidence)
+                            found.append(f"  ✅ Found: {repo['full_name']} ({level}: {confidence:.2f})")
+                    if found:
+                        print("\n".join(found))
+                            
+        except Exception as e:
+            print(f"  ⚠️  GitHub scan error: {e}")
+    
+    # Repository indicators checked by _analyze_repo_for_openclaw
+    _REPO_NAME_TERMS = ("openclaw", "clawbot")
+    _REPO_DESC_TERMS = ("openclaw", "clawbot", "ai agent", "gateway")
+    _REPO_TOPIC_TERMS = frozenset({"agent", "bot"})
     
     def _analyze_repo_for_openclaw(self, repo: dict) -> Tuple[List[DetectionFactor], float]:
         """Analyze repository for OpenClaw indicators with multi-factor scoring"""
-        factors = []
-        
-        # Name match
         name = repo.get("name", "").lower()
-        name_match = "openclaw" in name or "clawbot" in name
-        factors.append(DetectionFactor(
-            factor_type="github_repo",
-            weight=0.15,
-            detected=name_match,
-            details={"match_type": "name", "matched": name_match}
-        ))
-        
-        # Description match
+        name_match = any(term in name for term in self._REPO_NAME_TERMS)
+        
         desc = (repo.get("description") or "").lower()
-        desc_match = any(term in desc for term in ["openclaw", "clawbot", "ai agent", "gateway"])
-        factors.append(DetectionFactor(
-            factor_type="github_repo",
-            weight=0.15,
-            detected=desc_match,
-            details={"match_type": "description", "matched": desc_match}
-        ))
-        
-        # Topics
-        topics = [t.lower() for t in repo.get("topics", [])]
-        topic_match = "agent" in topics or "bot" in topics
-        factors.append(DetectionFactor(
-            factor_type="github_repo",
-            weight=0.15,
-            detected=topic_match,
-            details={"match_type": "topics", "matched": topic_match}
-        ))
+        desc_match = any(term in desc for term in self._REPO_DESC_TERMS)
+        
+        topics = {t.lower() for t in repo.get("topics", [])}
+        topic_match = not self._REPO_TOPIC_TERMS.isdisjoint(topics)
+        
+        # Most search hits match nothing; skip building factors and scoring
+        if not (name_match or desc_match or topic_match):
+            return [], 0.0
+        
+        # Only matched indicators become factors; calculate_confidence skips
+        # undetected ones anyway
+        factors = [
+            DetectionFactor(
+                factor_type="github_repo",
+                weight=0.15,
+                detected=True,
+                details={"match_type": match_type, "matched": True}
+            )
+            for match_type, matched in (
+                ("name", name_match),
+                ("description", desc_match),
+                ("topics", topic_match),
+            )
+            if matched
+        ]
         
         confidence, _ = self.scorer.calculate_confidence(factors)
         return factors, confidence
@@ -456,14 +590,16 @@ class OpenClawScanner:
             "clawbot config",
         ]
         
-        for query in queries:
+        async def search(query: str):
             try:
                 url = "https://api.github.com/search/code"
                 params = {"q": f"{query} extension:json extension:yaml extension:yml", "per_page": 20}
                 
                 async with self.session.get(url, params=params) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await resp.json(loads=_json_loads)
+                        now = _utcnow()
+                        found = []
                         for item in data.get("items", []):
                             factors = [DetectionFactor(
                                 factor_type="gist_config",
@@ -475,13 +611,11 @@ class OpenClawScanner:
                             
                             if confidence > 0.5:
                                 sig = OpenClawSignature(
-                                    signature_id=hashlib.sha256(
-                                        item["html_url"].encode()
-                                    ).hexdigest()[:16],
+                                    signature_id=_signature_id(item["html_url"]),
                                     signature_type=OpenClawSignatureType.EXTENSION,
                                     confidence_score=confidence,
                                     platform="github-gist",
-                                    detected_at=datetime.utcnow(),
+                                    detected_at=now,
                                     endpoint=item["html_url"],
                                     version_hint=None,
                                     capabilities=["config_file", "gist"],
@@ -492,13 +626,16 @@ class OpenClawScanner:
                                     },
                                     detection_factors=factors
                                 )
-                                self.discovered.append(sig)
-                                print(f"  ✅ Gist found: {item.get('name')} ({confidence:.2f})")
+                                if not self._record(sig):
+                                    continue
+                                found.append(f"  ✅ Gist found: {item.get('name')} ({confidence:.2f})")
+                        if found:
+                            print("\n".join(found))
                                 
-                await asyncio.sleep(1)
-                
             except Exception as e:
                 print(f"  ⚠️  Gist scan error: {e}")
+        
+        await self._run_spaced(search, queries, interval=1.0)
     
     async def _scan_telegram_bots(self):
         """Identify Telegram bots that might be OpenClaw-based"""
@@ -584,42 +721,53 @@ class OpenClawScanner:
             "_openclaw.example.com",
         ]
         
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_DNS_QUERIES)
+        
+        async def query(domain: str) -> List[str]:
+            async with sem:
+                return await self._query_dns_txt(domain)
+        
+        results = await asyncio.gather(
+            *(query(domain) for domain in domains_to_check),
+            return_exceptions=True,
+        )
+        
         discovered_count = 0
-        for domain in domains_to_check:
-            try:
-                txt_records = await self._query_dns_txt(domain)
-                for record in txt_records:
-                    if self._is_openclaw_txt_record(record):
-                        factors = [DetectionFactor(
-                            factor_type="dns_txt_record",
-                            weight=0.45,
-                            detected=True,
-                            details={"domain": domain, "record": record[:100]}
-                        )]
-                        confidence, _ = self.scorer.calculate_confidence(factors)
-                        
-                        sig = OpenClawSignature(
-                            signature_id=hashlib.sha256(domain.encode()).hexdigest()[:16],
-                            signature_type=OpenClawSignatureType.DNS,
-                            confidence_score=confidence,
-                            platform="dns",
-                            detected_at=datetime.utcnow(),
-                            endpoint=domain,
-                            version_hint=None,
-                            capabilities=["dns_txt", "openclaw_config"],
-                            metadata={
-                                "txt_record": record[:200],
-                                "record_type": "TXT",
-                            },
-                            detection_factors=factors
-                        )
-                        self.discovered.append(sig)
-                        discovered_count += 1
-                        
-            except DNSException:
-                pass
-            except Exception as e:
-                print(f"  ⚠️  DNS scan error for {domain}: {e}")
+        now = _utcnow()
+        for domain, txt_records in zip(domains_to_check, results):
+            if isinstance(txt_records, Exception):
+                if not isinstance(txt_records, DNSException):
+                    print(f"  ⚠️  DNS scan error for {domain}: {txt_records}")
+                continue
+            
+            for record in txt_records:
+                if self._is_openclaw_txt_record(record):
+                    factors = [DetectionFactor(
+                        factor_type="dns_txt_record",
+                        weight=0.45,
+                        detected=True,
+                        details={"domain": domain, "record": record[:100]}
+                    )]
+                    confidence, _ = self.scorer.calculate_confidence(factors)
+                    
+                    sig = OpenClawSignature(
+                        signature_id=_signature_id(domain),
+                        signature_type=OpenClawSignatureType.DNS,
+                        confidence_score=confidence,
+                        platform="dns",
+                        detected_at=now,
+                        endpoint=domain,
+                        version_hint=None,
+                        capabilities=["dns_txt", "openclaw_config"],
+                        metadata={
+                            "txt_record": record[:200],
+                            "record_type": "TXT",
+                        },
+                        detection_factors=factors
+                    )
+                    if not self._record(sig):
+                        continue
+                    discovered_count += 1
         
         print(f"  DNS TXT records checked: {len(domains_to_check)}")
         if discovered_count > 0:
@@ -630,23 +778,27 @@ class OpenClawScanner:
         if not DNS_AVAILABLE:
             return []
         
-        loop = asyncio.get_event_loop()
+        if domain in self._txt_cache:
+            return self._txt_cache[domain]
+        
+        # dnspython's asyncio resolver sends the query on the event loop
+        # rather than tying up a thread-pool worker per lookup
         try:
-            answers = await loop.run_in_executor(
-                None, 
-                lambda: dns.resolver.resolve(domain, 'TXT')
-            )
-            return [str(rdata) for rdata in answers]
+            answers = await dns.asyncresolver.resolve(domain, 'TXT', lifetime=5.0)
+            records = [str(rdata) for rdata in answers]
         except DNSException:
-            return []
+            records = []
+        self._txt_cache[domain] = records
+        return records
+    
+    # Substrings marking a TXT record as OpenClaw's ("_openclaw" is covered
+    # by "openclaw")
+    _TXT_RECORD_MARKERS = ("openclaw", "clawbot", "gateway-mode")
     
     def _is_openclaw_txt_record(self, record: str) -> bool:
         """Check if a TXT record contains OpenClaw indicators"""
         record_lower = record.lower()
-        return any(
-            pattern in record_lower 
-            for pattern in ["openclaw", "clawbot", "gateway-mode", "_openclaw"]
-        )
+        return any(marker in record_lower for marker in self._TXT_RECORD_MARKERS)
     
     async def _scan_docker_hub(self):
         """Scan Docker Hub for OpenClaw-related images"""
@@ -660,14 +812,18 @@ class OpenClawScanner:
         ]
         
         discovered_count = 0
-        for term in search_terms:
+        
+        async def search(term: str):
+            nonlocal discovered_count
             try:
                 url = "https://hub.docker.com/api/search/v3/catalog/search"
                 params = {"query": term, "page_size": 20}
                 
                 async with self.session.get(url, params=params) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await resp.json(loads=_json_loads)
+                        now = _utcnow()
+                        found = []
                         for result in data.get("results", []):
                             factors = [DetectionFactor(
                                 factor_type="docker_image",
@@ -683,13 +839,11 @@ class OpenClawScanner:
                             
                             if confidence > 0.5:
                                 sig = OpenClawSignature(
-                                    signature_id=hashlib.sha256(
-                                        result["name"].encode()
-                                    ).hexdigest()[:16],
+                                    signature_id=_signature_id(result["name"]),
                                     signature_type=OpenClawSignatureType.CONTAINER,
                                     confidence_score=confidence,
                                     platform="docker-hub",
-                                    detected_at=datetime.utcnow(),
+                                    detected_at=now,
                                     endpoint=f"https://hub.docker.com/r/{result['name']}",
                                     version_hint=None,
                                     capabilities=["container", "docker"],
@@ -701,15 +855,18 @@ class OpenClawScanner:
                                     },
                                     detection_factors=factors
                                 )
-                                self.discovered.append(sig)
+                                if not self._record(sig):
+                                    continue
                                 discovered_count += 1
-                                print(f"  ✅ Image: {result.get('name')} ({confidence:.2f})")
+                                found.append(f"  ✅ Image: {result.get('name')} ({confidence:.2f})")
+                        if found:
+                            print("\n".join(found))
                                 
-                await asyncio.sleep(0.5)
-                
             except Exception as e:
                 print(f"  ⚠️  Docker Hub scan error: {e}")
         
+        await self._run_spaced(search, search_terms, interval=0.5)
+        
         print(f"  Docker images found: {discovered_count}")
     
     async def _scan_shodan(self):
@@ -728,38 +885,36 @@ class OpenClawScanner:
             'x-gateway-mode',
         ]
         
-        try:
-            for query in queries:
+        async def search(query: str):
+            try:
                 url = "https://api.shodan.io/shodan/host/search"
                 params = {"key": api_key, "query": query, "limit": 100}
                 
                 async with self.session.get(url, params=params) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await resp.json(loads=_json_loads)
+                        now = _utcnow()
+                        found = []
                         for match in data.get("matches", []):
+                            header_names = self._shodan_header_names(match)
                             factors = [
                                 DetectionFactor(
-                                    factor_type="header_x_clawbot_id",
-                                    weight=0.25,
-                                    detected="x-clawbot-id" in str(match.get("http", {}))
-                                ),
-                                DetectionFactor(
-                                    factor_type="header_x_gateway_mode",
+                                    factor_type=f"header_{header.replace('-', '_')}",
                                     weight=0.25,
-                                    detected="x-gateway-mode" in str(match.get("http", {}))
-                                ),
+                                    detected=True
+                                )
+                                for header in ("x-clawbot-id", "x-gateway-mode")
+                                if header in header_names
                             ]
                             confidence, _ = self.scorer.calculate_confidence(factors)
                             
                             if confidence > 0.5:
                                 sig = OpenClawSignature(
-                                    signature_id=hashlib.sha256(
-                                        str(match.get("ip_str")).encode()
-                                    ).hexdigest()[:16],
+                                    signature_id=_signature_id(str(match.get("ip_str"))),
                                     signature_type=OpenClawSignatureType.GATEWAY,
                                     confidence_score=confidence,
                                     platform="shodan",
-                                    detected_at=datetime.utcnow(),
+                                    detected_at=now,
                                     endpoint=f"{match.get('ip_str')}:{match.get('port')}",
                                     version_hint=None,
                                     capabilities=["shodan_discovery", "public_ip"],
@@ -772,13 +927,35 @@ class OpenClawScanner:
                                     },
                                     detection_factors=factors
                                 )
-                                self.discovered.append(sig)
-                                print(f"  ✅ Shodan match: {match.get('ip_str')}:{match.get('port')} ({confidence:.2f})")
+                                if not self._record(sig):
+                                    continue
+                                found.append(f"  ✅ Shodan match: {match.get('ip_str')}:{match.get('port')} ({confidence:.2f})")
+                        if found:
+                            print("\n".join(found))
                                 
-                await asyncio.sleep(1)
-                
-        except Exception as e:
-            print(f"  ⚠️  Shodan scan error: {e}")
+            except Exception as e:
+                print(f"  ⚠️  Shodan scan error: {e}")
+        
+        await self._run_spaced(search, queries, interval=1.0)
+    
+    @staticmethod
+    def _shodan_header_names(match: Dict) -> Set[str]:
+        """
+        Lowercased HTTP response header names of a Shodan match.
+        
+        Shodan banners carry the raw response head in "data"; a parsed
+        "http.headers" mapping is used too when present.
+        """
+        headers = (match.get("http") or {}).get("headers") or {}
+        names = {name.lower() for name in headers}
+        
+        # Skip the status line; headers end at the first blank line
+        for line in (match.get("data") or "").splitlines()[1:]:
+            name, sep, _ = line.partition(":")
+            if not sep:
+                break
+            names.add(name.strip().lower())
+        return names
     
     async def _scan_censys(self):
         """Scan using Censys API (requires API key)"""
@@ -797,18 +974,20 @@ class OpenClawScanner:
             'services.http.response.headers.x_openclaw_version',
         ]
         
-        try:
-            # Censys API v2 uses Basic Auth
-            auth = base64.b64encode(f"{api_id}:{api_secret}".encode()).decode()
-            
-            for query in queries:
+        # Censys API v2 uses Basic Auth
+        auth = base64.b64encode(f"{api_id}:{api_secret}".encode()).decode()
+        
+        async def search(query: str):
+            try:
                 url = "https://search.censys.io/api/v2/hosts/search"
                 headers = {"Authorization": f"Basic {auth}"}
                 params = {"q": query, "per_page": 100}
                 
                 async with self.session.get(url, headers=headers, params=params) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await resp.json(loads=_json_loads)
+                        now = _utcnow()
+                        found = []
                         for result in data.get("result", {}).get("hits", []):
                             factors = [DetectionFactor(
                                 factor_type="header_combo",
@@ -820,13 +999,11 @@ class OpenClawScanner:
                             
                             if confidence > 0.5:
                                 sig = OpenClawSignature(
-                                    signature_id=hashlib.sha256(
-                                        result.get("ip").encode()
-                                    ).hexdigest()[:16],
+                                    signature_id=_signature_id(result.get("ip")),
                                     signature_type=OpenClawSignatureType.GATEWAY,
                                     confidence_score=confidence,
                                     platform="censys",
-                                    detected_at=datetime.utcnow(),
+                                    detected_at=now,
                                     endpoint=result.get("ip"),
                                     version_hint=None,
                                     capabilities=["censys_discovery", "public_ip"],
@@ -837,13 +1014,44 @@ class OpenClawScanner:
                                     },
                                     detection_factors=factors
                                 )
-                                self.discovered.append(sig)
-                                print(f"  ✅ Censys match: {result.get('ip')} ({confidence:.2f})")
+                                if not self._record(sig):
+                                    continue
+                                found.append(f"  ✅ Censys match: {result.get('ip')} ({confidence:.2f})")
+                        if found:
+                            print("\n".join(found))
                                 
-                await asyncio.sleep(1)
-                
-        except Exception as e:
-            print(f"  ⚠️  Censys scan error: {e}")
+            except Exception as e:
+                print(f"  ⚠️  Censys scan error: {e}")
+        
+        await self._run_spaced(search, queries, interval=1.0)
+    
+    @staticmethod
+    async def _run_spaced(search, items: List[str], interval: float):
+        """
+        Run search(item) for every item concurrently, starting them
+        `interval` seconds apart.
+        
+        Keeps each API's request rate while overlapping the round trips,
+        instead of waiting for every response before the next pause.
+        """
+        async def start(delay: float, item: str):
+            await asyncio.sleep(delay)
+            await search(item)
+        
+        await asyncio.gather(
+            *(start(i * interval, item) for i, item in enumerate(items))
+        )
+    
+    async def probe_endpoints(self, urls: List[str]) -> List[OpenClawSignature]:
+        """Probe many URLs concurrently, at most MAX_CONCURRENT_PROBES at a time"""
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_PROBES)
+        
+        async def probe(url: str) -> Optional[OpenClawSignature]:
+            async with sem:
+                return await self.probe_endpoint(url)
+        
+        results = await asyncio.gather(*(probe(url) for url in urls))
+        return [sig for sig in results if sig]
     
     async def probe_endpoint(self, url: str) -> Optional[OpenClawSignature]:
         """
@@ -852,15 +1060,14 @@ class OpenClawScanner:
         """
         try:
             async with self.session.get(url) as resp:
-                headers = dict(resp.headers)
-                body = await resp.text()
+                # aiohttp's CIMultiDict already matches names case-insensitively
+                headers = resp.headers
                 
                 factors = []
                 
                 # Check for header combinations (high confidence)
-                header_keys = [k.lower() for k in headers.keys()]
                 for combo in self.SIGNATURE_PATTERNS["header_combinations"]:
-                    if all(h.lower() in header_keys for h in combo):
+                    if all(header in headers for header in combo):
                         factors.append(DetectionFactor(
                             factor_type="header_combo",
                             weight=0.35,
@@ -869,8 +1076,8 @@ class OpenClawScanner:
                         ))
                 
                 # Check individual headers
-                for header in ["x-clawbot-id", "x-openclaw-version"]:
-                    if any(header in k for k in header_keys):
+                for header in ("x-clawbot-id", "x-openclaw-version"):
+                    if header in headers:
                         factors.append(DetectionFactor(
                             factor_type=f"header_{header.replace('-', '_')}",
                             weight=0.25,
@@ -878,48 +1085,26 @@ class OpenClawScanner:
                             details={"header_value": headers.get(header, "present")}
                         ))
                 
-                # Check body patterns
-                for pattern in self.SIGNATURE_PATTERNS["response_body"]:
-                    if re.search(pattern, body, re.IGNORECASE):
-                        factors.append(DetectionFactor(
-                            factor_type="body_pattern",
-                            weight=0.20,
-                            detected=True,
-                            details={"pattern": pattern}
-                        ))
-                
-                # Check /health endpoint signatures
-                if "/health" in url:
-                    for pattern in self.SIGNATURE_PATTERNS["health_signatures"]:
-                        if re.search(pattern, body, re.IGNORECASE):
-                            factors.append(DetectionFactor(
-                                factor_type="body_health_signature",
-                                weight=0.30,
-                                detected=True,
-                                details={"pattern": pattern}
-                            ))
-                
-                # Check /status endpoint signatures
-                if "/status" in url:
-                    for pattern in self.SIGNATURE_PATTERNS["status_signatures"]:
-                        if re.search(pattern, body, re.IGNORECASE):
-                            factors.append(DetectionFactor(
-                                factor_type="body_status_signature",
-                                weight=0.30,
-                                detected=True,
-                                details={"pattern": pattern}
-                            ))
-                
-                # Calculate confidence
                 confidence, reasoning = self.scorer.calculate_confidence(factors)
                 
+                # Only download the body when the headers alone aren't conclusive
+                if confidence < self.BODY_SKIP_CONFIDENCE:
+                    # Signatures sit near the top of a response; don't download
+                    # the tail of large pages
+                    raw = await self._read_body_prefix(resp.content, self.MAX_PROBE_BODY_BYTES)
+                    body = raw.decode("utf-8", errors="ignore").lower()
+                    body_factors = self._body_factors(url, body)
+                    if body_factors:
+                        factors.extend(body_factors)
+                        confidence, reasoning = self.scorer.calculate_confidence(factors)
+                
                 if confidence > 0.5:
                     return OpenClawSignature(
-                        signature_id=hashlib.sha256(url.encode()).hexdigest()[:16],
+                        signature_id=_signature_id(url),
                         signature_type=OpenClawSignatureType.GATEWAY,
                         confidence_score=confidence,
                         platform="web",
-                        detected_at=datetime.utcnow(),
+                        detected_at=_utcnow(),
                         endpoint=url,
                         version_hint=headers.get("x-openclaw-version"),
                         capabilities=[f.factor_type for f in factors if f.detected],
@@ -935,6 +1120,63 @@ class OpenClawScanner:
             pass
             
         return None
+    
+    @staticmethod
+    async def _read_body_prefix(content: aiohttp.StreamReader, limit: int) -> bytes:
+        """
+        Read up to `limit` bytes of a response body.
+        
+        StreamReader.read(n) returns whatever is buffered, which may be only
+        the first network chunk, so keep reading until the cap or EOF.
+        """
+        chunks = []
+        remaining = limit
+        while remaining > 0:
+            chunk = await content.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    
+    def _body_factors(self, url: str, body: str) -> List[DetectionFactor]:
+        """Match a lowercased response body against the body signatures"""
+        factors = []
+        
+        # Check body patterns
+        if any(key in body for key in self._BODY_KEYS):
+            for pattern, regex in self._BODY_PATTERNS:
+                if regex.search(body):
+                    factors.append(DetectionFactor(
+                        factor_type="body_pattern",
+                        weight=0.20,
+                        detected=True,
+                        details={"pattern": pattern}
+                    ))
+        
+        # Check /health endpoint signatures
+        if "/health" in url:
+            for pattern, regex in self._HEALTH_PATTERNS:
+                if regex.search(body):
+                    factors.append(DetectionFactor(
+                        factor_type="body_health_signature",
+                        weight=0.30,
+                        detected=True,
+                        details={"pattern": pattern}
+                    ))
+        
+        # Check /status endpoint signatures
+        if "/status" in url:
+            for pattern, regex in self._STATUS_PATTERNS:
+                if regex.search(body):
+                    factors.append(DetectionFactor(
+                        factor_type="body_status_signature",
+                        weight=0.30,
+                        detected=True,
+                        details={"pattern": pattern}
+                    ))
+        
+        return factors
 
 
 class PassiveTrafficAnalyzer:
@@ -976,23 +1218,77 @@ class PassiveTrafficAnalyzer:
         },
     }
     
-    def analyze_packet(self, packet_data: bytes) -> Optional[Dict]:
-        """Analyze a network packet for OpenClaw indicators"""
-        findings = {
-            "is_openclaw": False,
-            "confidence": 0.0,
-            "indicators": [],
+    # Flattened (signature, category) pairs so analyze_packet walks a single
+    # tuple instead of re-checking every category dict per packet
+    _PAYLOAD_SIGNATURES = tuple(
+        (sig, category)
+        for category, patterns in OPENCLAW_TRAFFIC_PATTERNS.items()
+        for sig in patterns.get("payload_signatures", ())
+    )
+    
+    _WS_PATTERNS = (
+        (b'"type":"openclaw', "openclaw_type"),
+        (b'"gateway":', "gateway_field"),
+        (b'"subagent_id":', "subagent_id"),
+        (b'"bridge_event":', "bridge_event"),
+        (b'"clawbot":', "clawbot_field"),
+    )
+    
+    _MAX_SIGNATURE_LEN = max(len(sig) for sig, _ in _PAYLOAD_SIGNATURES)
+    
+    def __init__(self):
+        self._stream_tail = b""
+        self._stream_seen: Set[bytes] = set()
+    
+    @staticmethod
+    def _packet_findings(indicators: List[str]) -> Optional[Dict]:
+        if not indicators:
+            return None
+        return {
+            "is_openclaw": True,
+            "confidence": 0.2 * len(indicators),
+            "indicators": indicators,
         }
+    
+    def open_stream(self) -> None:
+        """Start scanning a reassembled stream of packets"""
+        self._stream_tail = b""
+        self._stream_seen = set()
+    
+    def scan_chunk(self, chunk: bytes) -> Optional[Dict]:
+        """
+        Scan the next packet of an open stream.
+        
+        Keeps the last few bytes of the previous chunk so signatures split
+        across packet boundaries still match; each signature is reported
+        at most once per stream.
+        """
+        data = self._stream_tail + chunk
+        self._stream_tail = data[-(self._MAX_SIGNATURE_LEN - 1):]
         
-        for category, patterns in self.OPENCLAW_TRAFFIC_PATTERNS.items():
-            if "payload_signatures" in patterns:
-                for sig in patterns["payload_signatures"]:
-                    if sig in packet_data:
-                        findings["is_openclaw"] = True
-                        findings["confidence"] += 0.2
-                        findings["indicators"].append(category)
-                        
-        return findings if findings["is_openclaw"] else None
+        indicators = []
+        for sig, category in self._PAYLOAD_SIGNATURES:
+            if sig not in self._stream_seen and sig in data:
+                self._stream_seen.add(sig)
+                indicators.append(category)
+        return self._packet_findings(indicators)
+    
+    def close_stream(self) -> Optional[Dict]:
+        """Finish the open stream and return findings for all of it"""
+        indicators = [
+            category for sig, category in self._PAYLOAD_SIGNATURES
+            if sig in self._stream_seen
+        ]
+        self.open_stream()
+        return self._packet_findings(indicators)
+    
+    def analyze_packet(self, packet_data: bytes) -> Optional[Dict]:
+        """Analyze a network packet for OpenClaw indicators"""
+        indicators = [
+            category for sig, category in self._PAYLOAD_SIGNATURES
+            if sig in packet_data
+        ]
+        return self._packet_findings(indicators)
     
     def analyze_websocket_frame(self, frame_data: bytes) -> Optional[Dict]:
         """Analyze WebSocket frame for OpenClaw patterns"""
@@ -1002,15 +1298,7 @@ class PassiveTrafficAnalyzer:
             "patterns_found": [],
         }
         
-        ws_patterns = [
-            (b'"type":"openclaw', "openclaw_type"),
-            (b'"gateway":', "gateway_field"),
-            (b'"subagent_id":', "subagent_id"),
-            (b'"bridge_event":', "bridge_event"),
-            (b'"clawbot":', "clawbot_field"),
-        ]
-        
-        for pattern, name in ws_patterns:
+        for pattern, name in self._WS_PATTERNS:
             if pattern in frame_data:
                 findings["is_openclaw_ws"] = True
                 findings["confidence"] += 0.25
@@ -1056,6 +1344,16 @@ class OpenClawBehavioralDetector:
         },
     }
     
+    # Indicators in matching form, prepared once rather than per message
+    _RESPONSE_INDICATORS = [
+        (indicator, indicator.lower())
+        for indicator in BEHAVIORAL_SIGNATURES["response_patterns"]["indicators"]
+    ]
+    _COMMAND_PATTERNS = [
+        (pattern, re.compile(pattern))
+        for pattern in BEHAVIORAL_SIGNATURES["command_structure"]["indicators"]
+    ]
+    
     def analyze_conversation(self, messages: List[Dict]) -> Tuple[float, List[str]]:
         """Analyze conversation for OpenClaw behavioral patterns"""
         score = 0.0
@@ -1063,16 +1361,17 @@ class OpenClawBehavioralDetector:
         
         for msg in messages:
             content = msg.get("content", "")
+            content_lower = content.lower()
             
             # Check response patterns
-            for indicator in self.BEHAVIORAL_SIGNATURES["response_patterns"]["indicators"]:
-                if indicator.lower() in content.lower():
+            for indicator, indicator_lower in self._RESPONSE_INDICATORS:
+                if indicator_lower in content_lower:
                     score += 0.1
                     indicators.append(f"response_pattern: {indicator[:30]}")
                     
             # Check command structure
-            for pattern in self.BEHAVIORAL_SIGNATURES["command_structure"]["indicators"]:
-                if re.search(pattern, content):
+            for pattern, regex in self._COMMAND_PATTERNS:
+                if regex.search(content):
                     score += 0.05
                     indicators.append(f"command_pattern: {pattern}")
         
@@ -1085,11 +1384,12 @@ class OutputFormatter:
     @staticmethod
     def to_json(signatures: List[OpenClawSignature]) -> str:
         """Convert signatures to JSON format"""
-        return json.dumps(
-            [s.to_dict() for s in signatures],
-            indent=2,
-            default=str
-        )
+        data = [s.to_dict() for s in signatures]
+        if ORJSON_AVAILABLE:
+            # Passthrough keeps datetimes going through default=str, as with json
+            option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+            return orjson.dumps(data, option=option, default=str).decode()
+        return json.dumps(data, indent=2, default=str)
     
     @staticmethod
     def to_csv(signatures: List[OpenClawSignature]) -> str:
@@ -1115,20 +1415,22 @@ class OutputFormatter:
         ])
         
         # Data rows
-        scorer = ConfidenceScorer()
-        for sig in signatures:
-            writer.writerow([
+        level_for = ConfidenceScorer().get_confidence_level
+        writer.writerows(
+            (
                 sig.signature_id,
                 sig.signature_type.value,
                 f"{sig.confidence_score:.4f}",
-                scorer.get_confidence_level(sig.confidence_score),
+                level_for(sig.confidence_score),
                 sig.platform,
                 sig.detected_at.isoformat(),
                 sig.endpoint or "N/A",
                 sig.version_hint or "N/A",
                 "|".join(sig.capabilities),
-                json.dumps(sig.metadata)
-            ])
+                json.dumps(sig.metadata),
+            )
+            for sig in signatures
+        )
         
         return output.getvalue()
     
@@ -1165,7 +1467,7 @@ class OutputFormatter:
         return {
             "source": "openclaw_scanner",
             "version": "2.0",
-            "scan_timestamp": datetime.utcnow().isoformat(),
+            "scan_timestamp": _utcnow().isoformat(),
             "total_discoveries": len(signatures),
             "by_type": {},
             "by_platform": {},
@@ -1195,6 +1497,9 @@ Examples:
   # Scan with Censys integration
   python openclaw.py --censys-id YOUR_ID --censys-secret YOUR_SECRET
 
+  # Probe several URLs concurrently
+  python openclaw.py --probe-url https://a.example.com --probe-url https://b.example.com
+
   # Full scan with all integrations
   python openclaw.py --shodan-api-key KEY --censys-id ID --censys-secret SECRET -o json
         """
@@ -1234,7 +1539,8 @@ Examples:
     parser.add_argument(
         "--probe-url",
         type=str,
-        help="Probe a specific URL for OpenClaw signatures"
+        action="append",
+        help="Probe a specific URL for OpenClaw signatures (repeatable)"
     )
     
     parser.add_argument(
@@ -1273,12 +1579,12 @@ async def main():
     async with OpenClawScanner(api_keys=api_keys) as scanner:
         # If specific URL probe requested
         if args.probe_url:
-            print(f"🔍 Probing specific URL: {args.probe_url}")
-            sig = await scanner.probe_endpoint(args.probe_url)
-            if sig:
-                scanner.discovered.append(sig)
-                print(f"  ✅ OpenClaw signature detected! Confidence: {sig.confidence_score:.2f}")
-            else:
+            print(f"🔍 Probing {len(args.probe_url)} URL(s): {', '.join(args.probe_url)}")
+            sigs = await scanner.probe_endpoints(args.probe_url)
+            for sig in sigs:
+                if scanner._record(sig):
+                    print(f"  ✅ OpenClaw signature detected at {sig.endpoint}! Confidence: {sig.confidence_score:.2f}")
+            if not sigs:
                 print("  ❌ No OpenClaw signature detected")
         else:
             # Run full scan
@@ -1302,7 +1608,7 @@ async def main():
     
     # Print or save output
     if args.output_file:
-        with open(args.output_file, "w") as f:
+        with open(args.output_file, "w", encoding="utf-8") as f:
             f.write(output)
         print(f"\n💾 Output saved to: {args.output_file}")
     else:
@@ -1315,16 +1621,12 @@ async def main():
         print("=" * 70)
         
         if signatures:
-            by_type = {}
-            by_platform = {}
-            by_confidence = defaultdict(int)
-            
             scorer = ConfidenceScorer()
-            for sig in signatures:
-                t = sig.signature_type.value
-                by_type[t] = by_type.get(t, 0) + 1
-                by_platform[sig.platform] = by_platform.get(sig.platform, 0) + 1
-                by_confidence[scorer.get_confidence_level(sig.confidence_score)] += 1
+            by_type = Counter(sig.signature_type.value for sig in signatures)
+            by_platform = Counter(sig.platform for sig in signatures)
+            by_confidence = Counter(
+                scorer.get_confidence_level(sig.confidence_score) for sig in signatures
+            )
             
             print(f"\nTotal discoveries (min confidence {args.min_confidence}): {len(signatures)}")
             
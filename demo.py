@@ -10,6 +10,12 @@ from pathlib import Path
 
 from highway.core import AgentHighway, HighwayConfig
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 async def main():
     print("""
@@ -81,12 +87,16 @@ async def main():
         },
     ]
     
-    # Save sample data
+    # Save sample data (one file per agent, as the JSON storage backend reads them)
+    agents_dir = Path("data/agents")
+    agents_dir.mkdir(parents=True, exist_ok=True)
     for agent in sample_agents:
-        filepath = Path(f"data/agents/{agent['agent_id']}.json")
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(agent, f, indent=2)
+        filepath = agents_dir / f"{agent['agent_id']}.json"
+        if ORJSON_AVAILABLE:
+            filepath.write_bytes(orjson.dumps(agent, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(agent, f, indent=2)
     
     print(f"✅ Loaded {len(sample_agents)} sample agents")
     
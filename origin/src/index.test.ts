@@ -132,6 +132,32 @@ describe('BeaconCollector', () => {
       expect(response.status).toBe(201);
     });
 
+    it('should accept unsigned liens', async () => {
+      const unsignedLien = {
+        agent_id: 'unsigned-agent',
+        agent_type: 'worker',
+        timestamp: Date.now(),
+        event_type: 'birth',
+        sequence: 1,
+        signature: ''
+      };
+
+      const request = new Request('http://localhost/beacon', {
+        method: 'POST',
+        body: JSON.stringify(unsignedLien)
+      });
+
+      mockState.storage.sql.exec.mockImplementation((sql: string, ...params: any[]) => {
+        if (sql.includes('SELECT sequence FROM agent_states')) {
+          throw new Error('Not found');
+        }
+        return { one: () => null, [Symbol.iterator]: function* () { yield* []; } };
+      });
+
+      const response = await collector.handleBeacon(request, {});
+      expect(response.status).toBe(201);
+    });
+
     it('should reject out-of-sequence liens', async () => {
       const lien: SignalLien = {
         agent_id: 'test-agent',
@@ -179,6 +205,107 @@ describe('BeaconCollector', () => {
     });
   });
 
+  describe('Signature Algorithms', () => {
+    it('should accept blake2b-128 liens without Ed25519 verification', async () => {
+      const lien: SignalLien = {
+        agent_id: 'mac-agent',
+        agent_type: 'worker',
+        timestamp: Date.now(),
+        event_type: 'birth',
+        sequence: 1,
+        signature: '0123456789abcdef0123456789abcdef',
+        public_key: 'fedcba9876543210fedcba9876543210',
+        sig_alg: 'blake2b-128'
+      };
+
+      mockState.storage.sql.exec.mockImplementation((sql: string, ...params: any[]) => {
+        if (sql.includes('SELECT sequence FROM agent_states')) {
+          throw new Error('Not found');
+        }
+        return { one: () => null, [Symbol.iterator]: function* () { yield* []; } };
+      });
+      const verifyEd25519 = vi.spyOn(collector, 'verifyEd25519Signature').mockResolvedValue(false);
+
+      const isValid = await collector.verifyLien(lien);
+      expect(isValid).toBe(true);
+      expect(verifyEd25519).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('Batch Ingestion', () => {
+    it('should record every lien in a batch', async () => {
+      const liens: SignalLien[] = [1, 2, 3].map((sequence) => ({
+        agent_id: 'batch-agent',
+        agent_type: 'worker',
+        timestamp: Date.now(),
+        event_type: sequence === 1 ? 'birth' : 'heartbeat',
+        sequence,
+        signature: 'test-sig',
+        public_key: 'test-key'
+      }));
+
+      const request = new Request('http://localhost/beacon/batch', {
+        method: 'POST',
+        body: JSON.stringify(liens)
+      });
+
+      const response = await collector.handleBeaconBatch(request, {});
+      const data = await response.json() as { recorded: number; rejected: unknown[] };
+
+      expect(response.status).toBe(201);
+      expect(data.recorded).toBe(3);
+      expect(data.rejected).toHaveLength(0);
+    });
+
+    it('should accept a gzip-compressed batch', async () => {
+      const liens: SignalLien[] = [{
+        agent_id: 'batch-agent',
+        agent_type: 'worker',
+        timestamp: Date.now(),
+        event_type: 'birth',
+        sequence: 1,
+        signature: 'test-sig',
+        public_key: 'test-key'
+      }];
+      const compressed = new Blob([JSON.stringify(liens)])
+        .stream()
+        .pipeThrough(new CompressionStream('gzip'));
+
+      const request = new Request('http://localhost/beacon/batch', {
+        method: 'POST',
+        headers: { 'Content-Encoding': 'gzip' },
+        body: await new Response(compressed).arrayBuffer()
+      });
+
+      const response = await collector.handleBeaconBatch(request, {});
+      const data = await response.json() as { recorded: number };
+
+      expect(response.status).toBe(201);
+      expect(data.recorded).toBe(1);
+    });
+
+    it('should reject an unsupported Content-Encoding', async () => {
+      const request = new Request('http://localhost/beacon', {
+        method: 'POST',
+        headers: { 'Content-Encoding': 'br' },
+        body: 'not-json'
+      });
+
+      const response = await collector.handleBeacon(request, {});
+      expect(response.status).toBe(415);
+    });
+
+    it('should reject a non-array batch body', async () => {
+      const request = new Request('http://localhost/beacon/batch', {
+        method: 'POST',
+        body: JSON.stringify({ agent_id: 'batch-agent' })
+      });
+
+      const response = await collector.handleBeaconBatch(request, {});
+      expect(response.status).toBe(400);
+    });
+  });
+
   describe('Agent State Updates', () => {
     it('should update agent state on birth', async () => {
       const lien: SignalLien = {
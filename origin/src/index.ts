@@ -27,6 +27,7 @@ export interface SignalLien {
   public_key: string;
   metadata?: Record<string, any>;
   lane?: string; // Protocol lane: a2a, mcp, custom
+  sig_alg?: string; // Signature algorithm, e.g. 'blake2b-128' from the Python beacon SDK
 }
 
 // Agent State Materialized View
@@ -44,6 +45,22 @@ interface AgentState {
   lane?: string;
 }
 
+/**
+ * Read a JSON request body, inflating it if the client compressed it.
+ * Returns null for a Content-Encoding the runtime cannot decode.
+ */
+async function readJsonBody<T>(request: Request): Promise<T | null> {
+  const encoding = request.headers.get('Content-Encoding')?.toLowerCase();
+  if (!encoding || encoding === 'identity') {
+    return await request.json() as T;
+  }
+  if ((encoding !== 'gzip' && encoding !== 'deflate') || !request.body) {
+    return null;
+  }
+  const inflated = request.body.pipeThrough(new DecompressionStream(encoding));
+  return await new Response(inflated).json() as T;
+}
+
 /**
  * BeaconCollector - Durable Object for collecting and aggregating signal liens
  */
@@ -144,7 +161,7 @@ export class BeaconCollector extends DurableObject<Env> {
     const corsHeaders = {
       'Access-Control-Allow-Origin': '*',
       'Access-Control-Allow-Methods': 'POST, GET, OPTIONS, DELETE',
-      'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+      'Access-Control-Allow-Headers': 'Content-Type, Content-Encoding, Authorization',
       'Access-Control-Max-Age': '86400',
     };
     
@@ -164,6 +181,11 @@ export class BeaconCollector extends DurableObject<Env> {
         return await this.handleBeacon(request, corsHeaders);
       }
       
+      // Receive a batch of beacons from one agent
+      if (request.method === 'POST' && url.pathname === '/beacon/batch') {
+        return await this.handleBeaconBatch(request, corsHeaders);
+      }
+      
       // WebSocket upgrade for real-time streaming
       if (url.pathname === '/beacon/ws') {
         return await this.handleWebSocket(request, corsHeaders);
@@ -208,22 +230,71 @@ export class BeaconCollector extends DurableObject<Env> {
   }
   
   async handleBeacon(request: Request, headers: Record<string, string>): Promise<Response> {
-    const lien: SignalLien = await request.json();
+    const lien = await readJsonBody<SignalLien>(request);
+    if (lien === null) {
+      return new Response(
+        JSON.stringify({ error: 'Unsupported Content-Encoding' }), 
+        { status: 415, headers: { ...headers, 'Content-Type': 'application/json' } }
+      );
+    }
     
-    // Validate required fields
-    if (!lien.agent_id || !lien.event_type || !lien.signature || !lien.timestamp) {
+    const result = await this.recordLien(lien);
+    if (result.error) {
       return new Response(
-        JSON.stringify({ error: 'Missing required fields' }), 
+        JSON.stringify({ error: result.error }), 
+        { status: result.status, headers: { ...headers, 'Content-Type': 'application/json' } }
+      );
+    }
+    
+    return new Response(
+      JSON.stringify({ status: 'Lien recorded', agent_id: lien.agent_id }), 
+      { status: 201, headers: { ...headers, 'Content-Type': 'application/json' } }
+    );
+  }
+  
+  async handleBeaconBatch(request: Request, headers: Record<string, string>): Promise<Response> {
+    const liens = await readJsonBody<SignalLien[]>(request);
+    if (liens === null) {
+      return new Response(
+        JSON.stringify({ error: 'Unsupported Content-Encoding' }), 
+        { status: 415, headers: { ...headers, 'Content-Type': 'application/json' } }
+      );
+    }
+    
+    if (!Array.isArray(liens)) {
+      return new Response(
+        JSON.stringify({ error: 'Expected an array of liens' }), 
         { status: 400, headers: { ...headers, 'Content-Type': 'application/json' } }
       );
     }
     
+    // Record in order so per-agent sequence checks see liens as emitted
+    let recorded = 0;
+    const rejected: { index: number; error: string }[] = [];
+    for (let i = 0; i < liens.length; i++) {
+      const result = await this.recordLien(liens[i]);
+      if (result.error) {
+        rejected.push({ index: i, error: result.error });
+      } else {
+        recorded++;
+      }
+    }
+    
+    return new Response(
+      JSON.stringify({ status: 'Batch recorded', recorded, rejected }), 
+      { status: 201, headers: { ...headers, 'Content-Type': 'application/json' } }
+    );
+  }
+  
+  async recordLien(lien: SignalLien): Promise<{ status: number; error?: string }> {
+    // Validate required fields (signature may be empty: SDKs only sign when configured to)
+    if (!lien || !lien.agent_id || !lien.event_type || !lien.timestamp) {
+      return { status: 400, error: 'Missing required fields' };
+    }
+    
     // Verify signature
     if (!await this.verifyLien(lien)) {
-      return new Response(
-        JSON.stringify({ error: 'Invalid signature' }), 
-        { status: 401, headers: { ...headers, 'Content-Type': 'application/json' } }
-      );
+      return { status: 401, error: 'Invalid signature' };
     }
     
     // Store lien
@@ -242,7 +313,7 @@ export class BeaconCollector extends DurableObject<Env> {
       lien.target_agent_id || null,
       lien.payload_hash || null,
       lien.sequence,
-      lien.signature,
+      lien.signature || '',
       lien.public_key || null,
       lien.metadata ? JSON.stringify(lien.metadata) : null
     );
@@ -262,10 +333,7 @@ export class BeaconCollector extends DurableObject<Env> {
       received_at: Date.now()
     });
     
-    return new Response(
-      JSON.stringify({ status: 'Lien recorded', agent_id: lien.agent_id }), 
-      { status: 201, headers: { ...headers, 'Content-Type': 'application/json' } }
-    );
+    return { status: 201 };
   }
   
   async verifyLien(lien: SignalLien): Promise<boolean> {
@@ -293,6 +361,13 @@ export class BeaconCollector extends DurableObject<Env> {
         return false;
       }
       
+      // The Python SDK's blake2b-128 signature is a MAC keyed with the
+      // agent's private key, which the collector never sees; it cannot be
+      // checked here, so only the sequence checks above apply to it
+      if (lien.sig_alg === 'blake2b-128') {
+        return true;
+      }
+      
       // Ed25519 signature verification using Web Crypto API
       if (lien.public_key && lien.signature) {
         const isValid = await this.verifyEd25519Signature(lien);
@@ -663,7 +738,7 @@ function getCollectorId(env: Env, request: Request): ReturnType<Env['BEACON_COLL
   const url = new URL(request.url);
   
   // For beacon POSTs, shard by agent_id
-  if (request.method === 'POST' && url.pathname === '/beacon') {
+  if (request.method === 'POST' && (url.pathname === '/beacon' || url.pathname === '/beacon/batch')) {
     // We'll parse the agent_id from the body in a moment
     // For now, return a placeholder that will be resolved
     return env.BEACON_COLLECTOR.idFromName('__PENDING__');
@@ -706,7 +781,7 @@ export default {
     const corsHeaders = {
       'Access-Control-Allow-Origin': '*',
       'Access-Control-Allow-Methods': 'POST, GET, OPTIONS, DELETE',
-      'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+      'Access-Control-Allow-Headers': 'Content-Type, Content-Encoding, Authorization',
     };
     
     if (request.method === 'OPTIONS') {
@@ -721,9 +796,11 @@ export default {
     }
     
     // For beacon POSTs, extract agent_id and shard
-    if (request.method === 'POST' && url.pathname === '/beacon') {
+    // (batches come from a single agent, so the first lien picks the shard)
+    if (request.method === 'POST' && (url.pathname === '/beacon' || url.pathname === '/beacon/batch')) {
       try {
-        const body = await request.clone().json() as SignalLien;
+        const parsed = await readJsonBody<SignalLien | SignalLien[]>(request.clone());
+        const body = Array.isArray(parsed) ? parsed[0] : parsed!;
         const shardKey = getShardKey(body.agent_id);
         const id = env.BEACON_COLLECTOR.idFromName(shardKey);
         const collector = env.BEACON_COLLECTOR.get(id);
@@ -27,6 +27,8 @@ from beacon.beacon_sdk import (
     NetworkError,
     SignalLien
 )
+from beacon.decorators import beacon_agent, beacon_task
+from beacon.sync_wrapper import SyncBeacon
 
 
 # =============================================================================
@@ -103,6 +105,24 @@ class TestSignalLien:
         assert data["lane"] == "a2a"
 
 
+    def test_signallien_to_dict_covers_all_fields(self, sample_signal_lien):
+        """Test that to_dict stays in sync with the dataclass fields."""
+        import dataclasses
+        
+        lien = dataclasses.replace(
+            sample_signal_lien,
+            parent_agent_id="parent-1",
+            target_agent_id="target-1",
+            sig_alg="blake2b-128"
+        )
+        assert set(lien.to_dict()) == {f.name for f in dataclasses.fields(SignalLien)}
+        assert lien.to_dict() == dataclasses.asdict(lien)
+        
+    def test_signallien_uses_slots(self, sample_signal_lien):
+        """Test that SignalLien instances carry no per-instance __dict__."""
+        assert not hasattr(sample_signal_lien, "__dict__")
+
+
 # =============================================================================
 # EventType Tests
 # =============================================================================
@@ -155,6 +175,9 @@ class TestBeaconConfig:
         assert config.retry_delay == 1.0
         assert config.auto_heartbeat is True
         assert config.lane == "default"
+        assert config.include_arg_metadata is False
+        assert config.sign_liens is False
+        assert config.track_task_ids is False
         
     def test_custom_config(self):
         """Test custom configuration values."""
@@ -218,6 +241,42 @@ class TestAgentBeacon:
         await beacon.disconnect()
         assert beacon._session is None
         
+    @pytest.mark.asyncio
+    async def test_beacons_share_session(self, beacon, beacon_config):
+        """Test that beacons on one loop share a session until the last disconnects."""
+        other = AgentBeacon(agent_id="test-agent-002", config=beacon_config)
+        await beacon.connect()
+        await other.connect()
+        assert beacon._session is other._session
+        
+        shared = beacon._session
+        await beacon.disconnect()
+        assert not shared.closed
+        await other.disconnect()
+        assert shared.closed
+        
+    @pytest.mark.asyncio
+    async def test_emit_over_http2(self, beacon):
+        """Test that http2 routes requests through a shared httpx client."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        beacon.config.http2 = True
+        
+        with patch.object(httpx.AsyncClient, "post", new=AsyncMock()) as mock_post:
+            mock_post.return_value = MagicMock(status_code=201, text='{"status": "ok"}')
+            await beacon.connect()
+            assert isinstance(beacon._session, httpx.AsyncClient)
+            
+            result = await beacon.emit(EventType.TASK_START, task_id="task-123")
+            
+            assert result is True
+            body = json.loads(mock_post.call_args.kwargs["content"])
+            assert body["task_id"] == "task-123"
+            
+            client = beacon._session
+            await beacon.disconnect()
+            assert client.is_closed
+        
     @pytest.mark.asyncio
     async def test_emit_increments_sequence(self, beacon, mock_beacon_server):
         """Test that emit increments sequence number."""
@@ -247,6 +306,15 @@ class TestAgentBeacon:
         
         assert result is True
         
+    @pytest.mark.asyncio
+    async def test_emit_unserializable_metadata(self, beacon, mock_beacon_server):
+        """Test unserializable metadata or payload is logged, not raised."""
+        await beacon.connect()
+        
+        assert await beacon.emit(EventType.TASK_START, metadata={"obj": object()}) is False
+        assert await beacon.emit(EventType.TASK_START, payload={"obj": object()}) is False
+        mock_beacon_server.assert_not_called()
+        
     @pytest.mark.asyncio
     async def test_emit_authentication_error(self, beacon):
         """Test handling of authentication error (401)."""
@@ -278,6 +346,26 @@ class TestAgentBeacon:
             # Should retry and eventually fail
             assert result is False
             
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,retried", [
+        (400, False), (415, False), (408, True), (429, True), (500, True), (503, True),
+    ])
+    async def test_emit_retries_only_transient_statuses(self, beacon, status, retried):
+        """Test that permanent client errors are not queued for retry."""
+        with patch('aiohttp.ClientSession.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status = status
+            mock_response.text = AsyncMock(return_value='error')
+            mock_post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_post.return_value.__aexit__ = AsyncMock(return_value=False)
+            
+            await beacon.connect()
+            with patch.object(beacon, "_schedule_retry") as schedule_retry:
+                assert await beacon.emit(EventType.TASK_START) is False
+            
+            assert schedule_retry.called is retried
+            assert mock_post.call_count == 1
+            
     @pytest.mark.asyncio
     async def test_emit_timeout(self, beacon):
         """Test handling of timeout error."""
@@ -317,6 +405,16 @@ class TestAgentBeacon:
         
         assert result is True
         
+    @pytest.mark.asyncio
+    async def test_emit_invalid_event_type(self, beacon, mock_beacon_server):
+        """Test that unknown event types are rejected without consuming a sequence number."""
+        await beacon.connect()
+        with pytest.raises(ValueError):
+            await beacon.emit("invalid_event")
+        
+        assert beacon._sequence == 0
+        mock_beacon_server.assert_not_called()
+        
     @pytest.mark.asyncio
     async def test_birth(self, beacon, mock_beacon_server):
         """Test birth event emission."""
@@ -348,7 +446,8 @@ class TestAgentBeacon:
         result = await beacon.task_start("task-123", payload={"input": "data"})
         
         assert result is True
-        assert "task-123" in beacon._active_tasks
+        assert beacon._active_task_count == 1
+        assert beacon._active_tasks is None
         
     @pytest.mark.asyncio
     async def test_task_complete(self, beacon, mock_beacon_server):
@@ -358,7 +457,31 @@ class TestAgentBeacon:
         result = await beacon.task_complete("task-123", result="success", payload={"output": "done"})
         
         assert result is True
-        assert "task-123" not in beacon._active_tasks
+        assert beacon._active_task_count == 0
+        
+    @pytest.mark.asyncio
+    async def test_task_tracking_ids(self, beacon_config, mock_beacon_server):
+        """Test that track_task_ids keeps the set of active task IDs."""
+        beacon_config.track_task_ids = True
+        beacon = AgentBeacon(agent_id="tracker", config=beacon_config)
+        await beacon.connect()
+        
+        await beacon.task_start("task-123")
+        await beacon.task_start("task-123")
+        assert beacon._active_tasks == {"task-123"}
+        assert beacon._active_task_count == 1
+        
+        await beacon.task_complete("task-123")
+        assert beacon._active_tasks == set()
+        assert beacon._active_task_count == 0
+        await beacon.disconnect()
+        
+    @pytest.mark.asyncio
+    async def test_task_count_never_negative(self, beacon, mock_beacon_server):
+        """Test that unmatched task_complete calls do not drive the count negative."""
+        await beacon.connect()
+        await beacon.task_complete("never-started")
+        assert beacon._active_task_count == 0
         
     @pytest.mark.asyncio
     async def test_handoff(self, beacon, mock_beacon_server):
@@ -397,6 +520,23 @@ class TestAgentBeacon:
         await beacon.stop_heartbeat()
         assert beacon._heartbeat_task is None
         
+    @pytest.mark.asyncio
+    async def test_heartbeat_skips_unchanged_state(self, beacon, mock_beacon_server):
+        """Test that idle heartbeats are coalesced until max silence elapses."""
+        beacon.config.heartbeat_max_silence = 60
+        await beacon.connect()
+        await beacon.start_heartbeat(interval=0.01)
+        await asyncio.sleep(0.05)
+        
+        assert mock_beacon_server.call_count == 1
+        
+        # A state change is reported on the next tick
+        beacon._active_task_count += 1
+        await asyncio.sleep(0.05)
+        await beacon.stop_heartbeat()
+        
+        assert mock_beacon_server.call_count == 2
+        
     @pytest.mark.asyncio
     async def test_stop_heartbeat_no_task(self, beacon):
         """Test stopping heartbeat when no task exists."""
@@ -448,6 +588,44 @@ class TestAgentBeacon:
         assert len(signature) > 0
         assert isinstance(signature, str)
         
+    @pytest.mark.asyncio
+    async def test_signature_matches_canonical_mac(self, beacon, sample_signal_lien):
+        """Test that the cached-prefix signature equals a full keyed BLAKE2b of the canonical message."""
+        import hashlib
+        
+        lien = sample_signal_lien
+        message = (
+            f"{lien.agent_id}\x1f{lien.agent_type}\x1f{lien.timestamp}\x1f{lien.sequence}\x1f"
+            f"{lien.event_type.value}\x1f{lien.task_id}\x1f\x1f\x1f{lien.payload_hash}"
+        )
+        expected = hashlib.blake2b(
+            message.encode(), key=beacon._private_key.encode(), digest_size=16
+        ).hexdigest()
+        
+        assert beacon._generate_signature(lien) == expected
+        # The cached prefix must not be consumed by signing
+        assert beacon._generate_signature(lien) == expected
+        
+    @pytest.mark.asyncio
+    async def test_signature_fields_do_not_collide(self, beacon, sample_signal_lien):
+        """Test that a delimiter-like character inside a field cannot shift field boundaries."""
+        import dataclasses
+        
+        a = dataclasses.replace(sample_signal_lien, task_id="t|x", parent_agent_id="p")
+        b = dataclasses.replace(sample_signal_lien, task_id="t", parent_agent_id="x|p")
+        assert beacon._generate_signature(a) != beacon._generate_signature(b)
+        
+    @pytest.mark.asyncio
+    async def test_signature_long_private_key(self, beacon_config, sample_signal_lien):
+        """Test that private keys longer than 64 bytes can still sign."""
+        beacon = AgentBeacon(
+            agent_id="test-agent-001",
+            agent_type="test_worker",
+            config=beacon_config,
+            private_key="k" * 200
+        )
+        assert len(beacon._generate_signature(sample_signal_lien)) == 32
+        
     @pytest.mark.asyncio
     async def test_payload_hashing(self, beacon):
         """Test payload hashing."""
@@ -456,7 +634,7 @@ class TestAgentBeacon:
         hash2 = beacon._hash_payload(payload)
         
         assert hash1 is not None
-        assert len(hash1) == 16  # First 16 chars of SHA256
+        assert len(hash1) == 16  # 8-byte BLAKE2b digest
         assert hash1 == hash2  # Deterministic
         
         # Different payload should give different hash
@@ -464,6 +642,60 @@ class TestAgentBeacon:
         hash3 = beacon._hash_payload(different_payload)
         assert hash1 != hash3
         
+    @pytest.mark.asyncio
+    async def test_payload_hashing_cached(self, beacon):
+        """Test that repeated identical payloads hit the digest cache."""
+        from beacon.beacon_sdk import _digest_payload
+        
+        _digest_payload.cache_clear()
+        beacon._hash_payload({"result": "success"})
+        beacon._hash_payload({"result": "success"})
+        
+        info = _digest_payload.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        
+    @pytest.mark.asyncio
+    async def test_payload_hashing_independent_of_json_backend(self, beacon):
+        """Test that the stdlib fallback hashes payloads like orjson does."""
+        payload = {"b": [1, 2.5, None], "a": {"nested": "välue"}}
+        hash_default = beacon._hash_payload(payload)
+        
+        with patch("beacon.beacon_sdk.ORJSON_AVAILABLE", False):
+            assert beacon._hash_payload(payload) == hash_default
+        
+    @pytest.mark.asyncio
+    async def test_payload_hashing_datetimes_independent_of_json_backend(self, beacon):
+        """Test the stdlib fallback encodes datetimes and enums like orjson does."""
+        payload = {"at": datetime(2024, 1, 2, 3, 4, 5, 6), "event": EventType.BIRTH}
+        hash_default = beacon._hash_payload(payload)
+        
+        with patch("beacon.beacon_sdk.ORJSON_AVAILABLE", False):
+            assert beacon._hash_payload(payload) == hash_default
+        
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_json_dumps_floats_are_strict_json(self, orjson_available):
+        """Test both JSON backends round-trip floats and never emit NaN or Infinity."""
+        from beacon.beacon_sdk import ORJSON_AVAILABLE, _json_dumps
+        
+        if orjson_available and not ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        
+        def reject_constant(name):
+            raise ValueError(f"non-standard JSON constant {name}")
+        
+        floats = {"big": 1e16, "small": 1e-7, "plain": 2.5, "max": 1.7976931348623157e308}
+        with patch("beacon.beacon_sdk.ORJSON_AVAILABLE", orjson_available):
+            encoded = _json_dumps(floats)
+            assert json.loads(encoded, parse_constant=reject_constant) == floats
+            
+            for value in (float("nan"), float("inf"), float("-inf")):
+                try:
+                    encoded = _json_dumps({"v": value})
+                except ValueError:
+                    continue
+                assert json.loads(encoded, parse_constant=reject_constant) == {"v": None}
+        
     @pytest.mark.asyncio
     async def test_payload_hashing_none(self, beacon):
         """Test payload hashing with None."""
@@ -482,10 +714,68 @@ class TestAgentBeacon:
         )
         
         assert result is True
+        body = json.loads(mock_beacon_server.call_args.kwargs["data"])
+        assert body["metadata"] == {"test": True, "additional": "data"}
+        assert beacon.metadata == {"test": True}
+        
+    @pytest.mark.asyncio
+    async def test_emit_body_fields(self, beacon, mock_beacon_server):
+        """Test the lien body posted by emit."""
+        await beacon.connect()
+        await beacon.emit(EventType.HANDOFF, target_agent_id="agent-002")
+        
+        body = json.loads(mock_beacon_server.call_args.kwargs["data"])
+        assert body["agent_id"] == "test-agent-001"
+        assert body["agent_type"] == "test_worker"
+        assert body["event_type"] == "handoff"
+        assert body["sequence"] == 1
+        assert body["target_agent_id"] == "agent-002"
+        assert body["lane"] == "test"
+        assert "task_id" not in body
+        assert "payload_hash" not in body
+        
+    @pytest.mark.asyncio
+    async def test_emit_unsigned_by_default(self, beacon, mock_beacon_server):
+        """Test that liens are not signed unless sign_liens is enabled."""
+        await beacon.connect()
+        await beacon.emit(EventType.HEARTBEAT)
+        
+        body = json.loads(mock_beacon_server.call_args.kwargs["data"])
+        assert body["signature"] == ""
+        assert "public_key" not in body
+        assert "sig_alg" not in body
+        
+    @pytest.mark.asyncio
+    async def test_unsigned_beacon_never_generates_keys(self, beacon, mock_beacon_server):
+        """Test that signing keys are only generated when something needs them."""
+        with patch("beacon.beacon_sdk.secrets.token_hex") as mock_token:
+            await beacon.connect()
+            await beacon.emit(EventType.HEARTBEAT)
+            mock_token.assert_not_called()
+        
+        assert beacon._private_key_value is None
+        # Reading the public key generates the key pair once
+        assert beacon._public_key == beacon._public_key
+        assert beacon._private_key_value is not None
+        
+    @pytest.mark.asyncio
+    async def test_emit_signed(self, beacon, mock_beacon_server):
+        """Test that sign_liens adds a verifiable signature."""
+        beacon.config.sign_liens = True
+        await beacon.connect()
+        await beacon.emit(EventType.TASK_START, task_id="task-123")
+        
+        body = json.loads(mock_beacon_server.call_args.kwargs["data"])
+        assert body["sig_alg"] == "blake2b-128"
+        assert body["public_key"] == beacon._public_key
+        fields = {k: v for k, v in body.items() if k not in ("signature", "event_type")}
+        lien = SignalLien(**fields, event_type=EventType(body["event_type"]), signature="")
+        assert body["signature"] == beacon._generate_signature(lien)
         
     @pytest.mark.asyncio
     async def test_retry_with_backoff(self, beacon):
-        """Test retry with exponential backoff."""
+        """Test background retry with jittered exponential backoff."""
+        beacon.config.max_retries = 3
         with patch('aiohttp.ClientSession.post') as mock_post:
             # Fail twice, then succeed
             mock_response_fail = MagicMock()
@@ -505,9 +795,467 @@ class TestAgentBeacon:
                 await beacon.connect()
                 result = await beacon.emit(EventType.TASK_START)
                 
-                assert result is True
-                # Should have slept with exponential backoff
-                assert mock_sleep.call_count == 2
+                # First attempt fails without blocking the caller
+                assert result is False
+                assert mock_sleep.call_count == 0
+                
+                await beacon._retry_queue.join()
+                
+                assert mock_post.call_count == 3
+                # Should have slept with exponential backoff plus jitter
+                delays = [call.args[0] for call in mock_sleep.call_args_list]
+                assert len(delays) == 2
+                assert 0.1 <= delays[0] <= 0.2
+                assert 0.2 <= delays[1] <= 0.3
+                
+    @pytest.mark.asyncio
+    async def test_retry_gives_up_after_max_retries(self, beacon):
+        """Test that retries stop after max_retries attempts."""
+        with patch('aiohttp.ClientSession.post') as mock_post:
+            mock_post.side_effect = aiohttp.ClientError("Connection refused")
+            
+            with patch('asyncio.sleep', new=AsyncMock()):
+                await beacon.connect()
+                await beacon.emit(EventType.TASK_START)
+                await beacon._retry_queue.join()
+                
+            assert mock_post.call_count == beacon.config.max_retries
+            assert beacon._retry_queue.empty()
+
+
+# =============================================================================
+# Batch Emission Tests
+# =============================================================================
+
+class TestBatchEmit:
+    """Tests for batched lien emission."""
+    
+    @pytest.fixture
+    def batch_config(self):
+        return BeaconConfig(
+            endpoint="https://test-agent-highway.example.com",
+            auto_heartbeat=False,
+            batch_emit=True,
+            batch_max_size=4,
+            batch_max_latency_ms=20,
+            lane="test"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_batch_coalesces_liens(self, batch_config, mock_beacon_server):
+        """Test that queued liens are posted as one batch request."""
+        beacon = AgentBeacon(agent_id="batch-agent", agent_type="test", config=batch_config)
+        await beacon.connect()
+        
+        for i in range(3):
+            assert await beacon.emit(EventType.HEARTBEAT) is True
+        await beacon.flush()
+        
+        mock_beacon_server.assert_called_once()
+        args, kwargs = mock_beacon_server.call_args
+        assert args[0].endswith("/beacon/batch")
+        assert [lien["sequence"] for lien in json.loads(kwargs["data"])] == [1, 2, 3]
+        await beacon.disconnect()
+        
+    @pytest.mark.asyncio
+    async def test_batch_respects_max_size(self, batch_config, mock_beacon_server):
+        """Test that batches are split at batch_max_size."""
+        beacon = AgentBeacon(agent_id="batch-agent", agent_type="test", config=batch_config)
+        await beacon.connect()
+        
+        for i in range(10):
+            await beacon.emit(EventType.HEARTBEAT)
+        await beacon.flush()
+        
+        sizes = [len(json.loads(call.kwargs["data"])) for call in mock_beacon_server.call_args_list]
+        assert sizes == [4, 4, 2]
+        await beacon.disconnect()
+        
+    @pytest.mark.asyncio
+    async def test_batch_rejections_logged(self, batch_config, mock_beacon_server):
+        """Test that liens the collector rejects from an accepted batch are logged."""
+        response = mock_beacon_server.return_value.__aenter__.return_value
+        response.text = AsyncMock(return_value=json.dumps({
+            "status": "Batch recorded",
+            "recorded": 1,
+            "rejected": [{"index": 1, "error": "Invalid signature"}],
+        }))
+        beacon = AgentBeacon(agent_id="batch-agent", agent_type="test", config=batch_config)
+        await beacon.connect()
+        
+        await beacon.emit(EventType.HEARTBEAT)
+        await beacon.emit(EventType.HEARTBEAT)
+        with patch("beacon.beacon_sdk.logger") as mock_logger:
+            await beacon.flush()
+        
+        mock_logger.warning.assert_called_once()
+        message = mock_logger.warning.call_args.args[0]
+        assert "rejected 1 lien(s)" in message
+        assert "#1: Invalid signature" in message
+        await beacon.disconnect()
+        
+    @pytest.mark.asyncio
+    async def test_disconnect_drains_queue(self, batch_config, mock_beacon_server):
+        """Test that disconnect posts liens still waiting in the queue."""
+        batch_config.batch_max_latency_ms = 10_000
+        beacon = AgentBeacon(agent_id="batch-agent", agent_type="test", config=batch_config)
+        await beacon.connect()
+        
+        await beacon.emit(EventType.TASK_START, task_id="task-1")
+        await beacon.emit(EventType.TASK_START, task_id="task-2")
+        await beacon.disconnect()
+        
+        assert beacon._flusher_task is None
+        posted = [lien for call in mock_beacon_server.call_args_list for lien in json.loads(call.kwargs["data"])]
+        assert [lien["task_id"] for lien in posted] == ["task-1", "task-2"]
+
+
+# =============================================================================
+# Compression Tests
+# =============================================================================
+
+class TestCompression:
+    """Tests for request body compression."""
+    
+    @pytest.mark.asyncio
+    async def test_gzip_large_bodies(self, beacon_config, mock_beacon_server):
+        """Test that bodies above the threshold are gzip-compressed."""
+        import gzip
+        
+        beacon_config.compression = "gzip"
+        beacon = AgentBeacon(agent_id="gz-agent", config=beacon_config)
+        await beacon.connect()
+        await beacon.emit(EventType.HEARTBEAT, metadata={"blob": "x" * 2048})
+        
+        kwargs = mock_beacon_server.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(kwargs["data"]))
+        assert body["metadata"]["blob"] == "x" * 2048
+        await beacon.disconnect()
+        
+    @pytest.mark.asyncio
+    async def test_small_bodies_uncompressed(self, beacon_config, mock_beacon_server):
+        """Test that bodies below the threshold are sent as-is."""
+        beacon_config.compression = "gzip"
+        beacon = AgentBeacon(agent_id="gz-agent", config=beacon_config)
+        await beacon.connect()
+        await beacon.emit(EventType.HEARTBEAT)
+        
+        kwargs = mock_beacon_server.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert json.loads(kwargs["data"])["agent_id"] == "gz-agent"
+        await beacon.disconnect()
+        
+    def test_zstd_falls_back_to_gzip(self, beacon_config):
+        """Test that zstd falls back to gzip when zstandard is missing."""
+        beacon_config.compression = "zstd"
+        with patch("beacon.beacon_sdk.ZSTD_AVAILABLE", False):
+            beacon = AgentBeacon(agent_id="zstd-agent", config=beacon_config)
+        assert beacon._content_encoding == "gzip"
+        
+    def test_unknown_compression_rejected(self, beacon_config):
+        """Test that unsupported compression names are rejected."""
+        beacon_config.compression = "lz4"
+        with pytest.raises(ValueError):
+            AgentBeacon(agent_id="bad", config=beacon_config)
+
+
+# =============================================================================
+# Decorator Tests
+# =============================================================================
+
+class TestBeaconTask:
+    """Tests for the @beacon_task decorator."""
+    
+    class Worker:
+        def __init__(self, beacon):
+            self._beacon = beacon
+        
+        @beacon_task(task_id_arg="job_id")
+        async def run(self, job_id, data=None):
+            return job_id
+        
+        @beacon_task(task_id_arg="job_id")
+        async def fail(self, job_id):
+            raise ValueError("boom")
+    
+    @pytest.mark.asyncio
+    async def test_task_id_from_positional_arg(self, beacon, mock_beacon_server):
+        """Test that task_id_arg is resolved from positional arguments."""
+        worker = self.Worker(beacon)
+        
+        assert await worker.run("job-1", {"x": 1}) == "job-1"
+        
+        bodies = [json.loads(call.kwargs["data"]) for call in mock_beacon_server.call_args_list]
+        assert [b["event_type"] for b in bodies] == ["task_start", "task_complete"]
+        assert all(b["task_id"] == "job-1" for b in bodies)
+        
+    @pytest.mark.asyncio
+    async def test_task_id_from_keyword_arg(self, beacon, mock_beacon_server):
+        """Test that task_id_arg is resolved from keyword arguments."""
+        worker = self.Worker(beacon)
+        
+        await worker.run(job_id="job-2")
+        
+        body = json.loads(mock_beacon_server.call_args_list[0].kwargs["data"])
+        assert body["task_id"] == "job-2"
+        
+    @pytest.mark.asyncio
+    async def test_arg_metadata_opt_in(self, beacon):
+        """Test that argument metadata is type-only and only sent when enabled."""
+        beacon.task_start = AsyncMock(return_value=True)
+        beacon.task_complete = AsyncMock(return_value=True)
+        worker = self.Worker(beacon)
+        
+        await worker.run("job-4", data={"big": "payload"})
+        assert beacon.task_start.call_args.args == ("job-4", None)
+        
+        beacon.config.include_arg_metadata = True
+        await worker.run("job-5", data={"big": "payload"})
+        assert beacon.task_start.call_args.args == (
+            "job-5",
+            {"arg_types": ["str"], "kwarg_keys": ["data"]}
+        )
+        
+    @pytest.mark.asyncio
+    async def test_task_start_does_not_block_call(self, beacon):
+        """Test that the wrapped call runs while task_start is still in flight."""
+        started = asyncio.Event()
+        
+        async def slow_task_start(task_id, payload=None):
+            await started.wait()
+            return True
+        
+        beacon.task_start = slow_task_start
+        beacon.task_complete = AsyncMock(return_value=True)
+        
+        class Worker:
+            _beacon = beacon
+            
+            @beacon_task()
+            async def run(self):
+                started.set()
+                return "done"
+        
+        assert await asyncio.wait_for(Worker().run(), timeout=1) == "done"
+        
+    @pytest.mark.asyncio
+    async def test_error_beacon_on_exception(self, beacon, mock_beacon_server):
+        """Test that an error beacon is emitted and the exception propagates."""
+        worker = self.Worker(beacon)
+        
+        with pytest.raises(ValueError):
+            await worker.fail("job-3")
+        
+        bodies = [json.loads(call.kwargs["data"]) for call in mock_beacon_server.call_args_list]
+        assert bodies[-1]["event_type"] == "error"
+        
+    @pytest.mark.asyncio
+    async def test_task_start_precedes_error_on_fast_failure(self, beacon):
+        """Test that task_start goes out before the error beacon when the call fails at once."""
+        events = []
+        
+        async def slow_task_start(task_id, payload=None):
+            await asyncio.sleep(0.01)
+            events.append("task_start")
+            return True
+        
+        async def record_error(error, context=None):
+            events.append("error")
+            return True
+        
+        beacon.task_start = slow_task_start
+        beacon.error = record_error
+        worker = self.Worker(beacon)
+        
+        with pytest.raises(ValueError):
+            await worker.fail("job-6")
+        
+        assert events == ["task_start", "error"]
+
+
+    @pytest.mark.asyncio
+    async def test_error_beacon_on_cancellation(self, beacon, mock_beacon_server):
+        """Test that cancelling a wrapped task still emits an error beacon."""
+        class Worker:
+            _beacon = beacon
+            
+            @beacon_task()
+            async def run(self):
+                await asyncio.sleep(10)
+        
+        task = asyncio.create_task(Worker().run())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        body = json.loads(mock_beacon_server.call_args.kwargs["data"])
+        assert body["event_type"] == "error"
+
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_error_beacon_propagates(self, beacon):
+        """Test that cancelling the caller while the error beacon is in flight cancels the task."""
+        error_sent = asyncio.Event()
+        
+        async def slow_error(error, context=None):
+            await asyncio.sleep(0.05)
+            error_sent.set()
+            return True
+        
+        beacon.task_start = AsyncMock(return_value=True)
+        beacon.error = slow_error
+        
+        task = asyncio.create_task(self.Worker(beacon).fail("job-7"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        assert task.cancelled()
+        # The shielded error beacon still completes in the background
+        await asyncio.wait_for(error_sent.wait(), timeout=1)
+
+
+class TestBeaconAgent:
+    """Tests for the @beacon_agent class decorator."""
+    
+    @staticmethod
+    def make_worker_class():
+        @beacon_agent("worker", auto_heartbeat=False)
+        class Worker:
+            def __init__(self, name):
+                self.name = name
+            
+            async def run(self):
+                return self.name
+        
+        return Worker
+    
+    def test_construction_without_event_loop(self, beacon_config):
+        """Test that decorated agents can be constructed synchronously."""
+        worker = self.make_worker_class()("w1", beacon_config=beacon_config)
+        
+        assert worker.name == "w1"
+        assert worker._beacon_started is False
+        assert worker._beacon._session is None
+        
+    @pytest.mark.asyncio
+    async def test_beacon_started_on_first_call(self, beacon_config, mock_beacon_server):
+        """Test that birth is emitted once, on the first async method call."""
+        worker = self.make_worker_class()("w1", beacon_config=beacon_config)
+        
+        assert await worker.run() == "w1"
+        assert await worker.run() == "w1"
+        
+        bodies = [json.loads(call.kwargs["data"]) for call in mock_beacon_server.call_args_list]
+        assert [b["event_type"] for b in bodies] == ["birth"]
+        await worker.cleanup()
+
+
+# =============================================================================
+# SyncBeacon Tests
+# =============================================================================
+
+class TestSyncBeacon:
+    """Tests for the synchronous beacon wrapper."""
+    
+    def test_queued_calls_sent_in_order(self, beacon_config, mock_beacon_server):
+        """Test that fire-and-forget calls return immediately and keep their order."""
+        beacon = SyncBeacon("sync-agent", "worker", config=beacon_config)
+        beacon.start()
+        
+        assert beacon.task_start("task-1") is True
+        assert beacon.emit("heartbeat") is True
+        assert beacon.task_complete("task-1") is True
+        beacon.shutdown()
+        
+        bodies = [json.loads(call.kwargs["data"]) for call in mock_beacon_server.call_args_list]
+        assert [b["event_type"] for b in bodies][:4] == [
+            "birth", "task_start", "heartbeat", "task_complete"
+        ]
+        assert [b["sequence"] for b in bodies][:4] == [1, 2, 3, 4]
+        
+    def test_wait_returns_send_result(self, beacon_config, mock_beacon_server):
+        """Test that wait=True blocks until the beacon has been posted."""
+        beacon = SyncBeacon("sync-agent", "worker", config=beacon_config)
+        beacon.start()
+        
+        assert beacon.emit("heartbeat", wait=True) is True
+        assert mock_beacon_server.call_count == 2
+        beacon.shutdown()
+        
+    def test_shutdown_stops_loop_thread(self, beacon_config, mock_beacon_server):
+        """Test that shutdown stops and closes the background loop."""
+        beacon = SyncBeacon("sync-agent", "worker", config=beacon_config)
+        beacon.start()
+        beacon.shutdown()
+        
+        assert not beacon._thread.is_alive()
+        assert beacon._loop.is_closed()
+        
+    def test_flush_sends_one_batch(self, mock_beacon_server):
+        """Test that queued beacons are coalesced into a single batch request."""
+        config = BeaconConfig(
+            endpoint="https://test-agent-highway.example.com",
+            batch_emit=True,
+            batch_max_latency_ms=60_000
+        )
+        beacon = SyncBeacon("sync-agent", "worker", config=config)
+        beacon.start()
+        for _ in range(10):
+            beacon.heartbeat()
+        beacon.flush()
+        
+        assert mock_beacon_server.call_count == 1
+        url = mock_beacon_server.call_args.args[0]
+        assert url.endswith("/beacon/batch")
+        assert len(json.loads(mock_beacon_server.call_args.kwargs["data"])) == 11
+        beacon.shutdown()
+        
+    def test_loop_thread_calls_held_until_done(self, beacon_config, mock_beacon_server):
+        """Test that calls made on the loop thread are kept alive and their errors logged."""
+        beacon = SyncBeacon("sync-agent", "worker", config=beacon_config)
+        beacon.start()
+        
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+        
+        async def submit_on_loop():
+            assert beacon._submit(fail) is True
+            held = len(beacon._tasks)
+            await asyncio.sleep(0.01)
+            return held
+        
+        with patch("beacon.sync_wrapper.logger") as mock_logger:
+            future = asyncio.run_coroutine_threadsafe(submit_on_loop(), beacon._loop)
+            assert future.result(timeout=5) == 1
+        
+        assert beacon._tasks == set()
+        mock_logger.error.assert_called_once()
+        beacon.shutdown()
+        
+    def test_full_buffer_drops_beacons(self, beacon_config):
+        """Test that fire-and-forget calls are dropped and counted when the buffer is full."""
+        beacon = SyncBeacon("sync-agent", "worker", config=beacon_config, max_pending=2)
+        
+        # No wakeup is scheduled for these, so the loop leaves them queued
+        beacon._pending.extend([None, None])
+        assert beacon.emit("heartbeat") is False
+        assert beacon.dropped_count == 1
+        beacon._loop.call_soon_threadsafe(beacon._loop.stop)
+        
+    @pytest.mark.asyncio
+    async def test_aemit_from_async_code(self, beacon_config, mock_beacon_server):
+        """Test that aemit awaits the send without blocking the caller's loop."""
+        beacon = SyncBeacon("sync-agent", "worker", config=beacon_config)
+        beacon.start()
+        
+        assert await beacon.aemit("heartbeat", payload={"n": 1}) is True
+        assert mock_beacon_server.call_count == 2
+        beacon.shutdown()
 
 
 # =============================================================================
@@ -0,0 +1,145 @@
+"""
+GitHub Collector Tests
+
+Tests for the GitHub agent collector including:
+- Search rate limiting (token bucket)
+- Waiting out GitHub's 403 rate-limit responses
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from collectors.github import GitHubAgentCollector, _RateLimiter
+
+
+class FakeClock:
+    """Loop clock that only moves when the patched asyncio.sleep is awaited."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+async def clock():
+    """Patch the running loop's clock and asyncio.sleep with a FakeClock."""
+    fake = FakeClock()
+    loop = asyncio.get_running_loop()
+    with patch.object(loop, "time", fake.time), \
+            patch("collectors.github.asyncio.sleep", fake.sleep):
+        yield fake
+
+
+# =============================================================================
+# _RateLimiter Tests
+# =============================================================================
+
+class TestRateLimiter:
+    """Tests for the search token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_wait(self, clock):
+        """Test that up to rate acquisitions pass at once, then callers wait for a token."""
+        limiter = _RateLimiter(rate=2, period=10)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        assert clock.sleeps == []
+
+        # Bucket empty: one token takes period / rate seconds to refill
+        await limiter.acquire()
+        assert clock.sleeps == [pytest.approx(5.0)]
+
+        await limiter.acquire()
+        assert clock.sleeps == [pytest.approx(5.0), pytest.approx(5.0)]
+
+    @pytest.mark.asyncio
+    async def test_refill_over_time(self, clock):
+        """Test that tokens refill with elapsed time, capped at rate."""
+        limiter = _RateLimiter(rate=2, period=10)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        # A long pause refills the bucket, but never past its capacity
+        clock.now += 100
+        await limiter.acquire()
+        await limiter.acquire()
+        assert clock.sleeps == []
+
+        await limiter.acquire()
+        assert clock.sleeps == [pytest.approx(5.0)]
+
+    @pytest.mark.asyncio
+    async def test_partial_refill_shortens_wait(self, clock):
+        """Test that a partly refilled token only waits for the remainder."""
+        limiter = _RateLimiter(rate=2, period=10)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        clock.now += 2  # 0.4 of a token
+        await limiter.acquire()
+        assert clock.sleeps == [pytest.approx(3.0)]
+
+
+# =============================================================================
+# Search Rate Limit Tests
+# =============================================================================
+
+class TestSearchRateLimit:
+    """Tests for GitHubAgentCollector._search_query's 403 handling."""
+
+    @pytest.fixture
+    def collector(self):
+        collector = GitHubAgentCollector(github_token="test-token")
+        collector._search_limiter.acquire = AsyncMock()
+        return collector
+
+    @pytest.mark.asyncio
+    async def test_403_waits_until_reset_and_retries_once(self, collector, clock):
+        """Test that a 403 sleeps until X-RateLimit-Reset, then retries once."""
+        now = 1_700_000_000.0
+        collector._get = AsyncMock(side_effect=[
+            (403, None, {"X-RateLimit-Reset": str(int(now) + 30)}),
+            (200, {"items": [{"full_name": "org/agent"}]}, {}),
+        ])
+
+        with patch("collectors.github.time.time", return_value=now):
+            items = await collector._search_query("agent", per_page=10)
+
+        assert items == [{"full_name": "org/agent"}]
+        assert collector._get.await_count == 2
+        assert clock.sleeps == [pytest.approx(31.0)]
+
+    @pytest.mark.asyncio
+    async def test_403_without_reset_falls_back_to_a_minute(self, collector, clock):
+        """Test that a 403 without a reset header waits 60s and gives up after one retry."""
+        collector._get = AsyncMock(return_value=(403, None, {}))
+
+        items = await collector._search_query("agent", per_page=10)
+
+        assert items == []
+        assert collector._get.await_count == 2
+        assert clock.sleeps == [60]
+
+    @pytest.mark.asyncio
+    async def test_past_reset_waits_one_second(self, collector, clock):
+        """Test that a reset time already in the past only waits the extra second."""
+        now = 1_700_000_000.0
+        collector._get = AsyncMock(side_effect=[
+            (403, None, {"X-RateLimit-Reset": str(int(now) - 5)}),
+            (200, {"items": []}, {}),
+        ])
+
+        with patch("collectors.github.time.time", return_value=now):
+            await collector._search_query("agent", per_page=10)
+
+        assert clock.sleeps == [pytest.approx(1.0)]
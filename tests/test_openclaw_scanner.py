@@ -9,6 +9,7 @@ Tests for the OpenClaw discovery scanner including:
 """
 
 import asyncio
+import dataclasses
 import json
 import re
 from datetime import datetime
@@ -17,6 +18,7 @@ from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 
 import pytest
 import aiohttp
+from multidict import CIMultiDict
 
 from collectors.openclaw import (
     OpenClawScanner,
@@ -24,6 +26,7 @@ from collectors.openclaw import (
     OpenClawSignatureType,
     DetectionFactor,
     ConfidenceScorer,
+    OpenClawBehavioralDetector,
     PassiveTrafficAnalyzer
 )
 
@@ -168,6 +171,16 @@ class TestConfidenceScorer:
         
         assert 0.0 < confidence < 1.0
         
+    def test_calculate_confidence_many_factors_saturates(self, scorer):
+        """Test many strong factors give 1.0 rather than overflowing."""
+        factors = [
+            DetectionFactor(factor_type="header_combo", weight=0.35, detected=True)
+        ] * 400
+        
+        confidence, _ = scorer.calculate_confidence(factors)
+        
+        assert confidence == 1.0
+        
     def test_calculate_confidence_false_positive_penalty(self, scorer):
         """Test false positive penalty application."""
         factors = [
@@ -184,6 +197,15 @@ class TestConfidenceScorer:
         # Should have FP penalty applied
         assert "FP penalty applied" in reasoning
         
+    def test_false_positive_check_ignores_dict_keys(self, scorer):
+        """Test FP patterns are matched against values, not keys."""
+        assert scorer._check_false_positive_indicators(
+            {"error_page": "https://gateway.example.com"}
+        ) is False
+        assert scorer._check_false_positive_indicators(
+            {"meta": {"servers": ["Nginx default site"]}}
+        ) is True
+        
     def test_get_confidence_level_critical(self, scorer):
         """Test confidence level classification - CRITICAL."""
         assert scorer.get_confidence_level(0.95) == "CRITICAL"
@@ -263,6 +285,13 @@ class TestOpenClawSignature:
         assert len(data["detection_factors"]) == 1
         assert data["detection_factors"][0]["factor_type"] == "telegram_pattern"
         
+    def test_signature_to_dict_covers_all_fields(self, sample_openclaw_signature):
+        """Test the hand-built dict keeps every dataclass field."""
+        data = sample_openclaw_signature.to_dict()
+        
+        assert set(data) == {f.name for f in dataclasses.fields(OpenClawSignature)}
+        assert data["metadata"] == sample_openclaw_signature.metadata
+        
     def test_signature_from_dict(self):
         """Test signature deserialization from dict."""
         data = {
@@ -340,6 +369,29 @@ class TestOpenClawScanner:
         assert scanner.scorer is not None
         assert scanner.api_keys == {}
         
+    @pytest.mark.asyncio
+    async def test_record_deduplicates_by_signature_id(self, scanner):
+        """Test duplicates are dropped and higher confidence wins."""
+        def make(confidence):
+            return OpenClawSignature(
+                signature_id="dup",
+                signature_type=OpenClawSignatureType.GATEWAY,
+                confidence_score=confidence,
+                platform="github",
+                detected_at=datetime.utcnow(),
+                endpoint="https://github.com/a/b",
+                version_hint=None,
+                capabilities=[],
+                metadata={},
+            )
+        
+        assert scanner._record(make(0.6)) is True
+        assert scanner._record(make(0.9)) is False
+        assert scanner._record(make(0.7)) is False
+        
+        assert len(scanner.discovered) == 1
+        assert scanner.discovered[0].confidence_score == 0.9
+        
     @pytest.mark.asyncio
     async def test_scanner_context_manager(self):
         """Test async context manager."""
@@ -378,6 +430,7 @@ class TestOpenClawScanner:
         factors, confidence = scanner._analyze_repo_for_openclaw(repo)
         
         assert confidence < 0.5
+        assert factors == []
         
     @pytest.mark.asyncio
     async def test_scanner_is_openclaw_txt_record(self, scanner):
@@ -399,7 +452,7 @@ class TestOpenClawScanner:
             "x-gateway-mode": "cloudflare",
             "x-openclaw-version": "2.1.0"
         }
-        mock_response.text = AsyncMock(return_value='{"status": "healthy", "gateway": "up"}')
+        mock_response.content.read = AsyncMock(side_effect=[b'{"status": "healthy", "gateway": "up"}', b""])
         
         scanner.session = MagicMock()
         scanner.session.get = MagicMock()
@@ -413,13 +466,98 @@ class TestOpenClawScanner:
         assert result.confidence_score > 0.5
         assert result.version_hint == "2.1.0"
         
+    @pytest.mark.asyncio
+    async def test_probe_endpoint_mixed_case_headers(self, scanner):
+        """Test header checks and version hint use case-insensitive lookups."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = CIMultiDict({
+            "X-OpenClaw-Version": "2.1.0",
+            "X-Gateway-Mode": "cloudflare",
+        })
+        mock_response.content.read = AsyncMock(side_effect=[b'{"openclaw": {"gateway_mode": true}}', b""])
+        
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        with patch.object(scanner, "session", session):
+            result = await scanner.probe_endpoint("https://test.example.com")
+        
+        assert result is not None
+        assert result.version_hint == "2.1.0"
+        # The header combination is conclusive on its own, so the body is skipped
+        assert result.confidence_score >= scanner.BODY_SKIP_CONFIDENCE
+        mock_response.content.read.assert_not_awaited()
+        factor_types = {f.factor_type for f in result.detection_factors}
+        assert {"header_combo", "header_x_openclaw_version"} <= factor_types
+        
+    @pytest.mark.asyncio
+    async def test_probe_endpoint_body_case_insensitive(self, scanner):
+        """Test body patterns match regardless of case."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(
+            side_effect=[b'{"OpenClaw": {"Gateway_Mode": TRUE}, "Talk": {"APIKEY": "x"}}', b""]
+        )
+        
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        with patch.object(scanner, "session", session):
+            result = await scanner.probe_endpoint("https://test.example.com")
+        
+        assert result is not None
+        mock_response.content.read.assert_any_await(scanner.MAX_PROBE_BODY_BYTES)
+        patterns = {f.details["pattern"] for f in result.detection_factors}
+        assert r'"openclaw"\s*:\s*{' in patterns
+        assert r'"talk"\s*:\s*.*"apiKey"' in patterns
+        
+    @pytest.mark.asyncio
+    async def test_probe_endpoint_body_in_several_chunks(self, scanner):
+        """Test the body is read past the first network chunk."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(side_effect=[
+            b'{"padding": "' + b"x" * 2000 + b'", ',
+            b'"status": "healthy", "gateway": "up", ',
+            b'"subagents": 4, "uptime": 3600}',
+            b"",
+        ])
+        
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        with patch.object(scanner, "session", session):
+            result = await scanner.probe_endpoint("https://test.example.com/health")
+        
+        assert result is not None
+        assert mock_response.content.read.await_count == 4
+        factor_types = [f.factor_type for f in result.detection_factors]
+        assert factor_types.count("body_health_signature") == 4
+        
+    @pytest.mark.asyncio
+    async def test_read_body_prefix_stops_at_limit(self, scanner):
+        """Test the body read stops once the cap is reached."""
+        content = MagicMock()
+        content.read = AsyncMock(side_effect=[b"a" * 6, b"b" * 4, b"c" * 6])
+        
+        raw = await scanner._read_body_prefix(content, 10)
+        
+        assert raw == b"a" * 6 + b"b" * 4
+        assert [c.args for c in content.read.await_args_list] == [(10,), (4,)]
+        
     @pytest.mark.asyncio
     async def test_probe_endpoint_no_indicators(self, scanner):
         """Test endpoint probing with no OpenClaw indicators."""
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"server": "nginx"}
-        mock_response.text = AsyncMock(return_value='<html>Regular page</html>')
+        mock_response.content.read = AsyncMock(side_effect=[b'<html>Regular page</html>', b""])
         
         scanner.session = MagicMock()
         scanner.session.get = MagicMock()
@@ -430,6 +568,31 @@ class TestOpenClawScanner:
         
         assert result is None
         
+    @pytest.mark.asyncio
+    async def test_probe_endpoints_filters_misses(self, scanner):
+        """Test concurrent probing returns only detected endpoints."""
+        hit = OpenClawSignature(
+            signature_id="abc",
+            signature_type=OpenClawSignatureType.GATEWAY,
+            confidence_score=0.9,
+            platform="web",
+            detected_at=datetime.utcnow(),
+            endpoint="https://hit.example.com",
+            version_hint=None,
+            capabilities=[],
+            metadata={},
+        )
+        
+        async def fake_probe(url):
+            return hit if url == hit.endpoint else None
+        
+        with patch.object(scanner, "probe_endpoint", side_effect=fake_probe):
+            results = await scanner.probe_endpoints(
+                ["https://miss.example.com", hit.endpoint]
+            )
+        
+        assert results == [hit]
+        
     @pytest.mark.asyncio
     async def test_probe_endpoint_error(self, scanner):
         """Test endpoint probing with error."""
@@ -461,6 +624,25 @@ class TestOpenClawScanner:
         # Should have found at least one signature
         assert len(scanner.discovered) >= 1
         
+    @pytest.mark.asyncio
+    async def test_scan_github_repos_deduplicates(self, scanner, mock_github_api_response):
+        """Test repos returned by several queries are recorded once."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value=mock_github_api_response)
+        
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        with patch.object(scanner, "session", session):
+            await scanner._scan_github_repos()
+        
+        endpoints = [sig.endpoint for sig in scanner.discovered]
+        assert session.get.call_count > 1
+        assert endpoints
+        assert len(endpoints) == len(set(endpoints))
+        
     @pytest.mark.asyncio
     async def test_scan_github_repos_rate_limit(self, scanner):
         """Test GitHub scanning with rate limit error."""
@@ -539,6 +721,21 @@ class TestPassiveTrafficAnalyzer:
         
         assert result is None
         
+    def test_scan_chunk_matches_across_packets(self, analyzer):
+        """Test stream scanning finds signatures split between packets."""
+        analyzer.open_stream()
+        
+        assert analyzer.scan_chunk(b'{"status": "ok", "gatew') is None
+        result = analyzer.scan_chunk(b'ay_mode": true, "gateway_mode": 1}')
+        
+        assert result is not None
+        assert result["indicators"] == ["gateway_communication"]
+        assert analyzer.scan_chunk(b'{"gateway_mode": 2}') is None
+        
+        summary = analyzer.close_stream()
+        assert summary["confidence"] == pytest.approx(0.2)
+        assert analyzer.close_stream() is None
+        
     def test_analyze_websocket_frame_with_openclaw(self, analyzer):
         """Test WebSocket frame analysis with OpenClaw."""
         frame_data = b'{"type":"openclaw.event", "gateway":"main"}'
@@ -557,6 +754,36 @@ class TestPassiveTrafficAnalyzer:
         assert result is None
 
 
+# =============================================================================
+# OpenClawBehavioralDetector Tests
+# =============================================================================
+
+class TestOpenClawBehavioralDetector:
+    """Tests for OpenClawBehavioralDetector class."""
+    
+    def test_analyze_conversation_matches(self):
+        """Test that response and command patterns are found case-insensitively."""
+        detector = OpenClawBehavioralDetector()
+        messages = [
+            {"content": "DELEGATING TO SUBAGENT now"},
+            {"content": "/gateway restart"},
+        ]
+        
+        score, indicators = detector.analyze_conversation(messages)
+        
+        assert score == pytest.approx(0.15)
+        assert indicators == [
+            "response_pattern: Delegating to subagent",
+            "command_pattern: /gateway\\s+\\w+",
+        ]
+        
+    def test_analyze_conversation_no_matches(self):
+        """Test a conversation without OpenClaw behavior."""
+        detector = OpenClawBehavioralDetector()
+        
+        assert detector.analyze_conversation([{"content": "hello"}]) == (0.0, [])
+
+
 # =============================================================================
 # Signature Pattern Tests
 # =============================================================================
@@ -685,6 +912,17 @@ class TestAPIIntegrations:
         
         scanner.session.get.assert_called()
         
+    def test_shodan_header_names(self):
+        """Test header names come from the banner and parsed headers."""
+        match = {
+            "data": "HTTP/1.1 200 OK\r\nX-Gateway-Mode: cloudflare\r\n\r\nx-clawbot-id: body text",
+            "http": {"headers": {"X-OpenClaw-Version": "2.1.0"}},
+        }
+        
+        names = OpenClawScanner._shodan_header_names(match)
+        
+        assert names == {"x-gateway-mode", "x-openclaw-version"}
+        
     @pytest.mark.asyncio
     async def test_scan_censys_no_credentials(self):
         """Test Censys scanning without credentials."""